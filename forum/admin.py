@@ -1,6 +1,10 @@
 """Admin module for forum."""
 
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.utils.functional import cached_property
 from forum.models import (
     ForumUser,
     CourseStat,
@@ -17,12 +21,32 @@ from forum.models import (
 )
 
 
+class NoCountPaginator(Paginator):
+    """
+    Paginator that never counts more than `max_count` rows.
+
+    Used on the admins of tables that grow without bound, where counting every
+    row on each changelist render is more expensive than the page itself. Only
+    the first `max_count` rows can be paged through; search or filter to reach
+    the others.
+    """
+
+    max_count = 10000
+
+    @cached_property
+    def count(self) -> int:
+        """Return the number of rows, capped at max_count."""
+        return self.object_list.order_by()[: self.max_count].count()
+
+
 @admin.register(ForumUser)
 class ForumUserAdmin(admin.ModelAdmin):  # type: ignore
     """Admin interface for ForumUser model."""
 
     list_display = ("user", "default_sort_key")
     search_fields = ("user__username", "user__email")
+    list_select_related = ("user",)
+    autocomplete_fields = ("user",)
 
 
 @admin.register(CourseStat)
@@ -40,7 +64,8 @@ class CourseStatAdmin(admin.ModelAdmin):  # type: ignore
         "last_activity_at",
     )
     search_fields = ("user__username", "course_id")
-    list_filter = ("course_id",)
+    list_select_related = ("user",)
+    autocomplete_fields = ("user",)
 
 
 @admin.register(CommentThread)
@@ -60,6 +85,10 @@ class CommentThreadAdmin(admin.ModelAdmin):  # type: ignore
     )
     search_fields = ("title", "body", "author__username", "course_id")
     list_filter = ("thread_type", "context", "closed", "pinned")
+    list_select_related = ("author",)
+    autocomplete_fields = ("author", "closed_by")
+    show_full_result_count = False
+    paginator = NoCountPaginator
 
 
 @admin.register(Comment)
@@ -77,6 +106,10 @@ class CommentAdmin(admin.ModelAdmin):  # type: ignore
     )
     search_fields = ("body", "author__username", "comment_thread__title")
     list_filter = ("endorsed", "anonymous")
+    list_select_related = ("author", "comment_thread", "comment_thread__author")
+    autocomplete_fields = ("author", "comment_thread", "parent")
+    show_full_result_count = False
+    paginator = NoCountPaginator
 
 
 @admin.register(EditHistory)
@@ -86,6 +119,11 @@ class EditHistoryAdmin(admin.ModelAdmin):  # type: ignore
     list_display = ("editor", "content_object_id", "created_at", "reason_code")
     search_fields = ("editor__username", "original_body")
     list_filter = ("reason_code",)
+    autocomplete_fields = ("editor",)
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[EditHistory]:
+        """Join the editor so that the changelist does not query it per row."""
+        return super().get_queryset(request).select_related("editor")
 
 
 @admin.register(AbuseFlagger)
@@ -95,6 +133,10 @@ class AbuseFlaggerAdmin(admin.ModelAdmin):  # type: ignore
     list_display = ("user", "content_object_id", "flagged_at")
     search_fields = ("user__username",)
     list_filter = ("content_type",)
+    list_select_related = ("user",)
+    autocomplete_fields = ("user",)
+    show_full_result_count = False
+    paginator = NoCountPaginator
 
 
 @admin.register(HistoricalAbuseFlagger)
@@ -104,6 +146,8 @@ class HistoricalAbuseFlaggerAdmin(admin.ModelAdmin):  # type: ignore
     list_display = ("user", "content_object_id", "flagged_at")
     search_fields = ("user__username",)
     list_filter = ("content_type",)
+    list_select_related = ("user",)
+    autocomplete_fields = ("user",)
 
 
 @admin.register(ReadState)
@@ -112,6 +156,8 @@ class ReadStateAdmin(admin.ModelAdmin):  # type: ignore
 
     list_display = ("user", "course_id")
     search_fields = ("user__username", "course_id")
+    list_select_related = ("user",)
+    autocomplete_fields = ("user",)
 
 
 @admin.register(LastReadTime)
@@ -120,6 +166,8 @@ class LastReadTimeAdmin(admin.ModelAdmin):  # type: ignore
 
     list_display = ("read_state", "comment_thread", "timestamp")
     search_fields = ("read_state__user__username", "comment_thread__title")
+    list_select_related = ("read_state__user", "comment_thread")
+    autocomplete_fields = ("read_state", "comment_thread")
 
 
 @admin.register(UserVote)
@@ -129,6 +177,8 @@ class UserVoteAdmin(admin.ModelAdmin):  # type: ignore
     list_display = ("user", "content_object_id", "vote")
     search_fields = ("user__username",)
     list_filter = ("vote",)
+    list_select_related = ("user",)
+    autocomplete_fields = ("user",)
 
 
 @admin.register(Subscription)
@@ -144,6 +194,15 @@ class SubscriptionAdmin(admin.ModelAdmin):  # type: ignore
     )
     search_fields = ("subscriber__username",)
     list_filter = ("source_content_type",)
+    autocomplete_fields = ("subscriber",)
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Subscription]:
+        """Join the subscriber and content type so rows are rendered from one query."""
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("subscriber", "source_content_type")
+        )
 
 
 @admin.register(MongoContent)
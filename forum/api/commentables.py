@@ -2,7 +2,11 @@
 Native Python Commenttables APIs.
 """
 
+from django.core.cache import cache
+
 from forum.backend import get_backend
+from forum.constants import COMMENTABLES_COUNTS_CACHE_TIMEOUT
+from forum.utils import get_commentables_counts_cache_key
 
 
 def get_commentables_stats(course_id: str) -> dict[str, int]:
@@ -17,6 +21,13 @@ def get_commentables_stats(course_id: str) -> dict[str, int]:
         The threads count for the given course_id based on thread_type.
         e.g.
         reponse = {'course': {'discussion': 1, 'question': 1}}
+
+    The counts are cached per course and invalidated whenever a thread of the
+    course is created, updated or deleted.
     """
     backend = get_backend(course_id)()
-    return backend.get_commentables_counts_based_on_type(course_id)
+    return cache.get_or_set(
+        get_commentables_counts_cache_key(course_id),
+        lambda: backend.get_commentables_counts_based_on_type(course_id),
+        timeout=COMMENTABLES_COUNTS_CACHE_TIMEOUT,
+    )
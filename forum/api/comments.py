@@ -6,7 +6,6 @@ import logging
 from typing import Any, Optional
 
 from django.core.exceptions import ObjectDoesNotExist
-from rest_framework.serializers import ValidationError
 
 from forum.backend import get_backend
 from forum.serializers.comment import CommentSerializer
@@ -14,11 +13,19 @@ from forum.utils import ForumV2RequestError
 
 log = logging.getLogger(__name__)
 
+# Keys of the comment documents that CommentSerializer reads as input.
+_SERIALIZER_FIELDS = frozenset(CommentSerializer._declared_fields)
+# Keys of the comment documents that CommentSerializer reads when representing them.
+_SERIALIZER_SOURCES = frozenset(
+    field.source or name for name, field in CommentSerializer._declared_fields.items()
+)
+
 
 def prepare_comment_api_response(
     comment: dict[str, Any],
     backend: Any,
     exclude_fields: Optional[list[str]] = None,
+    skip_validation: bool = True,
 ) -> dict[str, Any]:
     """
     Return serialized validated data.
@@ -26,30 +33,39 @@ def prepare_comment_api_response(
     Parameters:
         comment: The comment details that needs to be serialized.
         exclude_fields: Any fields that need to be excluded from response.
+        skip_validation: Serialize the comment as is, without running it through
+            the serializer validators. Comments read from the backend don't need
+            to be validated.
 
     Response:
         serialized validated data of the comment.
     """
-    comment_data = {
-        **comment,
-        "id": str(comment.get("_id")),
-        "user_id": comment.get("author_id"),
-        "thread_id": str(comment.get("comment_thread_id")),
-        "username": comment.get("author_username"),
-        "parent_id": str(comment.get("parent_id")),
-        "type": str(comment.get("_type", "")).lower(),
-    }
-    if not exclude_fields:
-        exclude_fields = []
-    exclude_fields.append("children")
+    exclude_fields = [*(exclude_fields or []), "children"]
+    if skip_validation:
+        comment_data = {
+            key: comment[key] for key in _SERIALIZER_SOURCES if key in comment
+        }
+        comment_data["parent_id"] = str(comment.get("parent_id"))
+        comment_data["type"] = str(comment.get("_type", "")).lower()
+        return CommentSerializer(
+            comment_data,
+            exclude_fields=exclude_fields,
+            backend=backend,
+        ).data
+
+    comment_data = {key: comment[key] for key in _SERIALIZER_FIELDS if key in comment}
+    comment_data["id"] = str(comment.get("_id"))
+    comment_data["user_id"] = comment.get("author_id")
+    comment_data["thread_id"] = str(comment.get("comment_thread_id"))
+    comment_data["username"] = comment.get("author_username")
+    comment_data["parent_id"] = str(comment.get("parent_id"))
+    comment_data["type"] = str(comment.get("_type", "")).lower()
     serializer = CommentSerializer(
         data=comment_data,
         exclude_fields=exclude_fields,
         backend=backend,
     )
-    if not serializer.is_valid(raise_exception=True):
-        raise ValidationError(serializer.errors)
-
+    serializer.is_valid(raise_exception=True)
     return serializer.data
 
 
@@ -104,13 +120,16 @@ def create_child_comment(
     """
     backend = get_backend(course_id)()
     try:
-        parent_comment = backend.validate_object("Comment", parent_comment_id)
+        parent_comment = backend.validate_object(
+            "Comment", parent_comment_id, projection={"comment_thread_id": 1}
+        )
     except ObjectDoesNotExist as exc:
         log.error("Forumv2RequestError for create child comment request.")
         raise ForumV2RequestError(
             f"Comment does not exists with Id: {parent_comment_id}"
         ) from exc
 
+    thread_id = parent_comment["comment_thread_id"]
     comment_id = backend.create_comment(
         {
             "body": body,
@@ -119,7 +138,7 @@ def create_child_comment(
             "anonymous": anonymous,
             "anonymous_to_peers": anonymous_to_peers,
             "depth": 1,
-            "comment_thread_id": backend.get_thread_id_by_comment_id(parent_comment_id),
+            "comment_thread_id": thread_id,
             "parent_id": parent_comment_id,
         }
     )
@@ -129,18 +148,15 @@ def create_child_comment(
         raise ForumV2RequestError("comment is not created")
 
     user = backend.get_user(user_id)
-    thread = backend.get_thread(parent_comment["comment_thread_id"])
+    thread = backend.get_thread(thread_id)
     if user and thread and comment:
-        backend.mark_as_read(user_id, parent_comment["comment_thread_id"])
-    try:
-        comment_data = prepare_comment_api_response(
-            comment,
-            backend,
-            exclude_fields=["endorsement", "sk"],
-        )
-        return comment_data
-    except ValidationError as error:
-        raise error
+        backend.mark_as_read(user_id, thread_id)
+    return prepare_comment_api_response(
+        comment,
+        backend,
+        exclude_fields=["endorsement", "sk"],
+        skip_validation=False,
+    )
 
 
 def update_comment(
@@ -176,14 +192,6 @@ def update_comment(
         The details of the comment that is updated.
     """
     backend = get_backend(course_key)()
-    try:
-        backend.validate_object("Comment", comment_id)
-    except ObjectDoesNotExist as exc:
-        log.error("Forumv2RequestError for update comment request.")
-        raise ForumV2RequestError(
-            f"Comment does not exists with Id: {comment_id}"
-        ) from exc
-
     updated_comment = backend.update_comment_and_get_updated_comment(
         comment_id,
         body,
@@ -198,18 +206,16 @@ def update_comment(
         endorsement_user_id,
     )
     if not updated_comment:
-        log.error("Forumv2RequestError for create child comment request.")
-        raise ForumV2RequestError("comment is not updated")
-    try:
-        return prepare_comment_api_response(
-            updated_comment,
-            backend,
-            exclude_fields=(
-                ["endorsement", "sk"] if updated_comment.get("parent_id") else ["sk"]
-            ),
-        )
-    except ValidationError as error:
-        raise error
+        log.error("Forumv2RequestError for update comment request.")
+        raise ForumV2RequestError(f"Comment does not exists with Id: {comment_id}")
+    return prepare_comment_api_response(
+        updated_comment,
+        backend,
+        exclude_fields=(
+            ["endorsement", "sk"] if updated_comment.get("parent_id") else ["sk"]
+        ),
+        skip_validation=False,
+    )
 
 
 def delete_comment(comment_id: str, course_id: Optional[str] = None) -> dict[str, Any]:
@@ -270,24 +276,23 @@ def create_parent_comment(
     """
     backend = get_backend(course_id)()
     try:
-        backend.validate_object("CommentThread", thread_id)
+        # The backends check that the thread exists while creating the comment.
+        comment_id = backend.create_comment(
+            {
+                "body": body,
+                "author_id": user_id,
+                "course_id": course_id,
+                "anonymous": anonymous,
+                "anonymous_to_peers": anonymous_to_peers,
+                "depth": 0,
+                "comment_thread_id": thread_id,
+            }
+        )
     except ObjectDoesNotExist as exc:
         log.error("Forumv2RequestError for create parent comment request.")
         raise ForumV2RequestError(
             f"Thread does not exists with Id: {thread_id}"
         ) from exc
-
-    comment_id = backend.create_comment(
-        {
-            "body": body,
-            "author_id": user_id,
-            "course_id": course_id,
-            "anonymous": anonymous,
-            "anonymous_to_peers": anonymous_to_peers,
-            "depth": 0,
-            "comment_thread_id": thread_id,
-        }
-    )
     if not comment_id:
         log.error("Forumv2RequestError for create parent comment request.")
         raise ForumV2RequestError("comment is not created")
@@ -295,14 +300,12 @@ def create_parent_comment(
     user = backend.get_user(user_id)
     if user and comment:
         backend.mark_as_read(user_id, thread_id)
-    try:
-        return prepare_comment_api_response(
-            comment,
-            backend,
-            exclude_fields=["endorsement", "sk"],
-        )
-    except ValidationError as error:
-        raise error
+    return prepare_comment_api_response(
+        comment,
+        backend,
+        exclude_fields=["endorsement", "sk"],
+        skip_validation=False,
+    )
 
 
 def get_course_id_by_comment(comment_id: str) -> str | None:
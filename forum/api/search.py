@@ -4,10 +4,17 @@ API for search.
 
 from typing import Any, Optional
 
+from django.core.cache import cache
+
 from forum.backend import get_backend
-from forum.constants import FORUM_DEFAULT_PAGE, FORUM_DEFAULT_PER_PAGE
+from forum.constants import (
+    FORUM_DEFAULT_PAGE,
+    FORUM_DEFAULT_PER_PAGE,
+    SEARCH_THREADS_CACHE_TIMEOUT,
+)
 from forum.search import get_thread_search_backend
 from forum.serializers.thread import ThreadSerializer
+from forum.utils import get_search_threads_cache_key
 
 
 def _get_thread_ids_from_indexes(
@@ -41,7 +48,8 @@ def _get_thread_ids_from_indexes(
         commentable_ids=commentable_ids,
         course_id=course_id,
     )
-    if not thread_ids:
+    # Only look for a spelling suggestion when nothing matches a non-empty text.
+    if not thread_ids and text:
         corrected_text = thread_search.get_suggested_text(text)
         if corrected_text:
             thread_ids = thread_search.get_thread_ids_with_corrected_text(
@@ -77,10 +85,39 @@ def search_threads(
 ) -> dict[str, Any]:
     """
     Search for threads based on the provided data.
+
+    Responses are cached for a short time. The cache of a course is invalidated
+    whenever one of its threads or comments changes, or is voted on or flagged,
+    and the cache of a user
+    whenever one of their read states changes.
     """
     group_ids = group_ids or []
     commentable_ids = commentable_ids or []
 
+    cache_key = get_search_threads_cache_key(
+        course_id,
+        user_id,
+        {
+            "text": text,
+            "group_ids": group_ids,
+            "commentable_ids": commentable_ids,
+            "author_id": author_id,
+            "thread_type": thread_type,
+            "sort_key": sort_key,
+            "context": context,
+            "flagged": flagged,
+            "unread": unread,
+            "unanswered": unanswered,
+            "unresponded": unresponded,
+            "count_flagged": count_flagged,
+            "page": page,
+            "per_page": per_page,
+        },
+    )
+    cached_data = cache.get(cache_key)
+    if cached_data is not None:
+        return cached_data
+
     thread_ids, corrected_text = _get_thread_ids_from_indexes(
         context, group_ids, text, commentable_ids, course_id
     )
@@ -122,4 +159,5 @@ def search_threads(
         data["corrected_text"] = corrected_text
         data["total_results"] = len(thread_ids)
 
+    cache.set(cache_key, data, timeout=SEARCH_THREADS_CACHE_TIMEOUT)
     return data
@@ -107,10 +107,7 @@ def prepare_thread_api_response(
         context=context,
         backend=backend,
     )
-    if not serializer.is_valid(raise_exception=True):
-        log.error(f"validation error in thread API call: {serializer.errors}")
-        raise ValidationError(serializer.errors)
-
+    serializer.is_valid(raise_exception=True)
     return serializer.data
 
 
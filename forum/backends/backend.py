@@ -140,7 +140,7 @@ class AbstractBackend:
 
     @staticmethod
     def prepare_thread(
-        thread_id: str,
+        thread: dict[str, Any],
         is_read: bool,
         unread_count: int,
         is_endorsed: bool,
@@ -166,7 +166,9 @@ class AbstractBackend:
         raise NotImplementedError
 
     @staticmethod
-    def validate_object(model: str, obj_id: str) -> Any:
+    def validate_object(
+        model: str, obj_id: str, projection: Optional[dict[str, Any]] = None
+    ) -> Any:
         """Validate object."""
         raise NotImplementedError
 
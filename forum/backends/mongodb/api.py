@@ -20,6 +20,7 @@ from forum.utils import (
     ForumV2RequestError,
     get_group_ids_from_params,
     get_sort_criteria,
+    invalidate_search_threads_cache,
     make_aware,
     str_to_bool,
 )
@@ -33,24 +34,11 @@ class MongoBackend(AbstractBackend):
         cls, user_id: str, course_id: str, **kwargs: Any
     ) -> None:
         """Update stats for a course."""
+        if Users().increment_course_stats(user_id, course_id, **kwargs):
+            return
         user = Users().get(user_id)
         if not user:
             return
-        course_stats = user.get("course_stats", [])
-        for course_stat in course_stats:
-            if course_stat["course_id"] == course_id:
-                course_stat.update(
-                    {
-                        k: course_stat[k] + v
-                        for k, v in kwargs.items()
-                        if k in course_stat
-                    }
-                )
-                Users().update(
-                    user_id,
-                    course_stats=course_stats,
-                )
-                return
         cls.build_course_stats(user["_id"], course_id)
 
     @classmethod
@@ -83,6 +71,7 @@ class MongoBackend(AbstractBackend):
                 entity["_id"],
                 abuse_flaggers=abuse_flaggers,
             )
+            invalidate_search_threads_cache(course_id=entity["course_id"])
         if first_flag_added:
             cls.update_stats_for_course(
                 entity["author_id"],
@@ -103,14 +92,13 @@ class MongoBackend(AbstractBackend):
         if not entity:
             raise ObjectDoesNotExist
 
-        first_historical_flag = (
-            has_no_historical_flags and not entity["historical_abuse_flaggers"]
-        )
-        if first_historical_flag:
-            cls.update_stats_for_course(user_id, entity["course_id"], inactive_flags=1)
-
+        stats: dict[str, int] = {}
+        if has_no_historical_flags and not entity["historical_abuse_flaggers"]:
+            stats["inactive_flags"] = 1
         if not entity["abuse_flaggers"]:
-            cls.update_stats_for_course(user_id, entity["course_id"], active_flags=-1)
+            stats["active_flags"] = -1
+        if stats:
+            cls.update_stats_for_course(user_id, entity["course_id"], **stats)
 
     @classmethod
     def un_flag_as_abuse(
@@ -141,6 +129,7 @@ class MongoBackend(AbstractBackend):
                 entity["_id"],
                 abuse_flaggers=entity["abuse_flaggers"],
             )
+            invalidate_search_threads_cache(course_id=entity["course_id"])
             cls.update_stats_after_unflag(
                 entity["author_id"], entity["_id"], has_no_historical_flags
             )
@@ -175,6 +164,7 @@ class MongoBackend(AbstractBackend):
             abuse_flaggers=[],
             historical_abuse_flaggers=historical_abuse_flaggers,
         )
+        invalidate_search_threads_cache(course_id=entity["course_id"])
         cls.update_stats_after_unflag(
             entity["author_id"], entity["_id"], has_no_historical_flags
         )
@@ -252,6 +242,7 @@ class MongoBackend(AbstractBackend):
             updated_count = content_model.update_votes(
                 content_id=content_id, votes=updated_votes
             )
+            invalidate_search_threads_cache(course_id=content["course_id"])
             return bool(updated_count)
 
         return False
@@ -631,7 +622,11 @@ class MongoBackend(AbstractBackend):
 
         sort_criteria = get_sort_criteria(sort_key)
 
-        comment_threads = CommentThread().find(base_query)
+        # Outside of raw queries, only the ids of the page are passed on to the
+        # presentor: don't load the rest of the documents.
+        comment_threads = CommentThread().find(
+            base_query, projection=None if raw_query else {"last_activity_at": True}
+        )
         thread_count = CommentThread().count_documents(base_query)
 
         if sort_criteria or raw_query:
@@ -700,7 +695,7 @@ class MongoBackend(AbstractBackend):
 
     @staticmethod
     def prepare_thread(
-        thread_id: str,
+        thread: dict[str, Any],
         is_read: bool,
         unread_count: int,
         is_endorsed: bool,
@@ -719,10 +714,6 @@ class MongoBackend(AbstractBackend):
         Returns:
             dict[str, Any]: A dictionary representing the prepared thread data.
         """
-        thread = CommentThread().get(thread_id)
-        if not thread:
-            raise ValueError("Thread does not exist.")
-
         return {
             "id": str(thread["_id"]),
             **thread,
@@ -775,7 +766,7 @@ class MongoBackend(AbstractBackend):
                 abuse_flagged_count = threads_flagged.get(thread_key, 0)
                 presenters.append(
                     cls.prepare_thread(
-                        thread["_id"],
+                        thread,
                         is_read,
                         unread_count,
                         is_endorsed,
@@ -803,13 +794,16 @@ class MongoBackend(AbstractBackend):
         return None
 
     @staticmethod
-    def validate_object(model: str, obj_id: str) -> Any:
+    def validate_object(
+        model: str, obj_id: str, projection: Optional[dict[str, Any]] = None
+    ) -> Any:
         """
         Validates the object if it exists or not.
 
         Parameters:
             model: The model for which to validate the id.
             id: The ID of the object to validate in the model.
+            projection: The fields to return, all of them if not provided.
         Response:
             raise exception if object does not exists.
             return object
@@ -818,7 +812,7 @@ class MongoBackend(AbstractBackend):
             "Comment": Comment,
             "CommentThread": CommentThread,
         }
-        instance = models[model]().get(obj_id)
+        instance = models[model]().get(obj_id, projection)
         if not instance:
             raise ObjectDoesNotExist
         return instance
@@ -1021,6 +1015,7 @@ class MongoBackend(AbstractBackend):
             depth=data.get("depth", 0),
             comment_thread_id=data["comment_thread_id"],
             parent_id=data.get("parent_id"),
+            require_thread=True,
         )
 
         if data.get("parent_id"):
@@ -1062,9 +1057,9 @@ class MongoBackend(AbstractBackend):
             edit_reason_code (Optional[str]): The reason for editing the comment, typically represented by a code.
             endorsement_user_id (Optional[str]): The ID of the user endorsing the comment.
         Response:
-            The details of the comment that is updated.
+            The details of the comment that is updated, or None if it does not exist.
         """
-        Comment().update(
+        modified_count = Comment().update(
             comment_id,
             body=body,
             course_id=course_id,
@@ -1077,6 +1072,8 @@ class MongoBackend(AbstractBackend):
             edit_reason_code=edit_reason_code,
             endorsement_user_id=endorsement_user_id,
         )
+        if not modified_count:
+            return None
         return Comment().get(comment_id)
 
     @staticmethod
@@ -1298,27 +1295,16 @@ class MongoBackend(AbstractBackend):
     def mark_as_read(cls, user_id: str, thread_id: str) -> None:
         """Mark thread as read."""
         user = Users().get(user_id)
-        thread = CommentThread().get(thread_id)
+        thread = CommentThread().get(thread_id, projection={"course_id": True})
         if not (user and thread):
             raise ValueError("User and/or Thread not found.")
-        read_state = cls.find_or_create_read_state(user["external_id"], thread["_id"])
-
-        read_state["last_read_times"].update(
-            {
-                str(thread["_id"]): datetime.now(timezone.utc),
-            }
+        Users().update_last_read_time(
+            user["external_id"],
+            thread["course_id"],
+            str(thread["_id"]),
+            datetime.now(timezone.utc),
         )
-        update_user = Users().get(user["external_id"])
-        if not update_user:
-            raise ObjectDoesNotExist
-        new_read_states = update_user["read_states"]
-        updated_read_states = []
-        for state in new_read_states:
-            if state["course_id"] == thread["course_id"]:
-                state = read_state
-            updated_read_states.append(state)
-
-        Users().update(user["external_id"], read_states=updated_read_states)
+        invalidate_search_threads_cache(user_id=str(user["external_id"]))
 
     @staticmethod
     def find_or_create_user_stats(user_id: str, course_id: str) -> dict[str, Any]:
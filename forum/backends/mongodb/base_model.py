@@ -38,9 +38,11 @@ class MongoBaseModel(ABC):
         """Override Query"""
         return query
 
-    def get(self, _id: str) -> Optional[dict[str, Any]]:
-        """Get a document by ID."""
-        return self._collection.find_one({"_id": ObjectId(_id)})
+    def get(
+        self, _id: str, projection: Optional[dict[str, Any]] = None
+    ) -> Optional[dict[str, Any]]:
+        """Get a document by ID, optionally restricted to the projected fields."""
+        return self._collection.find_one({"_id": ObjectId(_id)}, projection)
 
     def get_list(self, **kwargs: Any) -> Cursor[dict[str, Any]]:
         """Get a list of all documents filtered by kwargs."""
@@ -59,18 +61,21 @@ class MongoBaseModel(ABC):
         result = self._collection.delete_one({"_id": ObjectId(_id)})
         return result.deleted_count
 
-    def find(self, query: dict[str, Any]) -> Cursor[dict[str, Any]]:
+    def find(
+        self, query: dict[str, Any], projection: Optional[dict[str, Any]] = None
+    ) -> Cursor[dict[str, Any]]:
         """
         Run a raw MongoDB query.
 
         Args:
             query: The MongoDB query.
+            projection: The fields to return, all of them by default.
 
         Returns:
             A cursor with the query results.
         """
         query = self.override_query(query)
-        return self._collection.find(query)
+        return self._collection.find(query, projection=projection)
 
     def find_one(self, query: dict[str, Any]) -> Optional[dict[str, Any]]:
         """
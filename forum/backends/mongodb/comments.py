@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Any, Optional
 
 from bson import ObjectId
+from django.core.exceptions import ObjectDoesNotExist
 
 from forum.backends.mongodb.contents import BaseContents
 from forum.backends.mongodb.threads import CommentThread
@@ -78,6 +79,7 @@ class Comment(BaseContents):
         abuse_flaggers: Optional[list[str]] = None,
         historical_abuse_flaggers: Optional[list[str]] = None,
         visible: bool = True,
+        require_thread: bool = False,
     ) -> str:
         """
         Inserts a new comment document into the database.
@@ -94,6 +96,8 @@ class Comment(BaseContents):
             abuse_flaggers (Optional[list[str]], optional): Users who flagged the comment. Defaults to None.
             historical_abuse_flaggers (Optional[list[str]], optional): Users historically flagged the comment.
             visible (bool, optional): Whether the comment is visible. Defaults to True.
+            require_thread (bool, optional): Raise ObjectDoesNotExist, without inserting
+                anything, if the comment thread does not exist. Defaults to False.
 
         Returns:
             str: The ID of the inserted document.
@@ -125,13 +129,20 @@ class Comment(BaseContents):
 
         comment_data["endorsement"] = None
 
+        # Counting the comment in its thread first also checks that the thread exists.
+        if (
+            not self.update_comment_count_in_comment_thread(comment_thread_id, 1)
+            and require_thread
+        ):
+            raise ObjectDoesNotExist(
+                f"Thread does not exists with Id: {comment_thread_id}"
+            )
+
         result = self._collection.insert_one(comment_data)
 
         if parent_id:
             self.update_child_count_in_parent_comment(parent_id, 1)
 
-        self.update_comment_count_in_comment_thread(comment_thread_id, 1)
-
         # Notify Comment inserted
         get_handler_by_name("comment_inserted").send(
             sender=self.__class__, comment_id=str(result.inserted_id)
@@ -218,33 +229,31 @@ class Comment(BaseContents):
         else:
             update_data["endorsement"] = None
 
+        update: dict[str, Any] = {"$set": update_data}
         if editing_user_id:
-            edit_history = []
             original_body = ""
-            if comment := Comment().get(comment_id):
-                edit_history = comment.get("edit_history", [])
+            if comment := Comment().get(comment_id, projection={"body": True}):
                 original_body = comment.get("body", "")
-            edit_history.append(
-                {
+            # Push the entry instead of rewriting the whole history, so that
+            # concurrent edits don't drop each other's entries.
+            update["$push"] = {
+                "edit_history": {
                     "author_id": editing_user_id,
                     "original_body": original_body,
                     "reason_code": edit_reason_code,
                     "editor_username": self.get_author_username(editing_user_id),
                     "created_at": datetime.now(),
                 }
-            )
-            update_data["edit_history"] = edit_history
+            }
 
         update_data["updated_at"] = datetime.now()
-        result = self._collection.update_one(
-            {"_id": ObjectId(comment_id)},
-            {"$set": update_data},
-        )
+        result = self._collection.update_one({"_id": ObjectId(comment_id)}, update)
 
         # Notify Comment updated
-        get_handler_by_name("comment_updated").send(
-            sender=self.__class__, comment_id=comment_id
-        )
+        if result.matched_count:
+            get_handler_by_name("comment_updated").send(
+                sender=self.__class__, comment_id=comment_id
+            )
 
         return result.modified_count
 
@@ -258,7 +267,14 @@ class Comment(BaseContents):
         Returns:
             The number of comments deleted.
         """
-        comment = self.get(_id)
+        comment = self._collection.find_one_and_delete(
+            {"_id": ObjectId(_id)},
+            projection={
+                "parent_id": True,
+                "comment_thread_id": True,
+                "course_id": True,
+            },
+        )
         if not comment:
             return 0
 
@@ -266,12 +282,10 @@ class Comment(BaseContents):
         child_comments_deleted_count = 0
         if not parent_comment_id:
             child_comments_deleted_count = self.delete_child_comments(_id)
-
-        result = self._collection.delete_one({"_id": ObjectId(_id)})
-        if parent_comment_id:
+        else:
             self.update_child_count_in_parent_comment(parent_comment_id, -1)
 
-        no_of_comments_delete = result.deleted_count + child_comments_deleted_count
+        no_of_comments_delete = 1 + child_comments_deleted_count
         comment_thread_id = comment["comment_thread_id"]
 
         self.update_comment_count_in_comment_thread(
@@ -280,7 +294,7 @@ class Comment(BaseContents):
 
         # Notify Comments deleted
         get_handler_by_name("comment_deleted").send(
-            sender=self.__class__, comment_id=_id
+            sender=self.__class__, comment_id=_id, course_id=comment.get("course_id")
         )
 
         return no_of_comments_delete
@@ -333,7 +347,7 @@ class Comment(BaseContents):
 
     def update_comment_count_in_comment_thread(
         self, comment_thread_id: str, count: int
-    ) -> None:
+    ) -> int:
         """
         Update(increment/decrement) comment_count in comment thread.
 
@@ -345,13 +359,15 @@ class Comment(BaseContents):
                     If negative, this function will decrease comment_count by the count.
 
         Returns:
-            None.
+            The number of updated threads, 0 if the thread does not exist.
         """
         update_comment_count_query = {
             "$inc": {"comment_count": count},
             "$set": {"last_activity_at": datetime.now()},
         }
-        CommentThread().update_count(comment_thread_id, update_comment_count_query)
+        return CommentThread().update_count(
+            comment_thread_id, update_comment_count_query
+        )
 
     def get_sk(self, _id: str, parent_id: Optional[str]) -> str:
         """Returns sk field."""
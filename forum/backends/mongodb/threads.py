@@ -7,6 +7,7 @@ from bson import ObjectId
 
 from forum.backends.mongodb.contents import BaseContents
 from forum.backends.mongodb.users import Users
+from forum.constants import COMMENTABLES_COUNTS_FIELDS
 from forum.utils import get_handler_by_name
 
 
@@ -20,9 +21,14 @@ class CommentThread(BaseContents):
 
     def delete(self, _id: str) -> int:
         """Delete CommentThread"""
+        thread = self._collection.find_one(
+            {"_id": ObjectId(_id)}, projection={"course_id": True}
+        )
         result = super().delete(_id)
         get_handler_by_name("comment_thread_deleted").send(
-            sender=self.__class__, comment_thread_id=_id
+            sender=self.__class__,
+            comment_thread_id=_id,
+            course_id=thread.get("course_id") if thread else None,
         )
         Users().delete_read_state_by_thread_id(_id)
         return result
@@ -286,7 +292,11 @@ class CommentThread(BaseContents):
 
         # Notify thread updated
         get_handler_by_name("comment_thread_updated").send(
-            sender=self.__class__, comment_thread_id=thread_id
+            sender=self.__class__,
+            comment_thread_id=thread_id,
+            commentables_counts_changed=bool(
+                COMMENTABLES_COUNTS_FIELDS.intersection(update_data)
+            ),
         )
         return result.modified_count
 
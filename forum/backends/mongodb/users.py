@@ -1,7 +1,10 @@
 """Users Class for mongo backend."""
 
+from datetime import datetime
 from typing import Any, Optional
 
+from bson import ObjectId
+
 from forum.backends.mongodb.base_model import MongoBaseModel
 
 
@@ -112,6 +115,60 @@ class Users(MongoBaseModel):
         )
         return result.modified_count
 
+    def increment_course_stats(
+        self, external_id: str, course_id: str, **counts: int
+    ) -> int:
+        """
+        Increments the counters of the course stats of a user in a single update.
+
+        Args:
+            external_id: The external ID of the user.
+            course_id: The course of the stats to update.
+            **counts: The increment of each counter, e.g. replies=-1.
+
+        Returns:
+            The number of documents matched, 0 if the user has no stats for the course.
+        """
+        result = self._collection.update_one(
+            {"external_id": external_id, "course_stats.course_id": course_id},
+            {"$inc": {f"course_stats.$.{key}": value for key, value in counts.items()}},
+        )
+        return result.matched_count
+
+    def update_last_read_time(
+        self, external_id: str, course_id: str, thread_id: str, timestamp: datetime
+    ) -> None:
+        """
+        Sets the time a user last read a thread, in the read state of its course.
+
+        Args:
+            external_id: The external ID of the user.
+            course_id: The course of the thread.
+            thread_id: The ID of the thread.
+            timestamp: The time the thread was read.
+        """
+        result = self._collection.update_one(
+            {"external_id": external_id, "read_states.course_id": course_id},
+            {"$set": {f"read_states.$.last_read_times.{thread_id}": timestamp}},
+        )
+        if result.matched_count:
+            return
+        result = self._collection.update_one(
+            {"external_id": external_id, "read_states.course_id": {"$ne": course_id}},
+            {
+                "$push": {
+                    "read_states": {
+                        "_id": ObjectId(),
+                        "course_id": course_id,
+                        "last_read_times": {thread_id: timestamp},
+                    }
+                }
+            },
+        )
+        if not result.matched_count:
+            # The read state of the course was created concurrently.
+            self.update_last_read_time(external_id, course_id, thread_id, timestamp)
+
     def delete_read_state_by_thread_id(self, thread_id: str) -> None:
         """Delete read state from users based on thread_id."""
         users = self.get_list(
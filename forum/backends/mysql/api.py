@@ -3,13 +3,15 @@
 import math
 import random
 from datetime import timedelta
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, Union
 
 from django.contrib.auth.models import User  # pylint: disable=E5142
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.paginator import Paginator
+from django.db import connections
 from django.db.models import (
+    BooleanField,
     Count,
     Case,
     Exists,
@@ -18,10 +20,13 @@ from django.db.models import (
     Max,
     OuterRef,
     Q,
+    QuerySet,
     Subquery,
     When,
     Sum,
+    Value,
 )
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
@@ -31,6 +36,7 @@ from forum.backends.mysql.models import (
     AbuseFlagger,
     Comment,
     CommentThread,
+    Content,
     CourseStat,
     EditHistory,
     ForumUser,
@@ -40,8 +46,27 @@ from forum.backends.mysql.models import (
     Subscription,
     UserVote,
 )
-from forum.constants import RETIRED_BODY, RETIRED_TITLE
-from forum.utils import get_group_ids_from_params
+from forum.constants import (
+    COMMENTABLES_COUNTS_FIELDS,
+    COURSE_STATS_COUNTERS,
+    RETIRED_BODY,
+    RETIRED_TITLE,
+)
+from forum.utils import (
+    get_group_ids_from_params,
+    invalidate_commentables_counts,
+    invalidate_forum_user_cache,
+    invalidate_search_threads_cache,
+)
+
+# Contents that are counted in the course stats of their author. These querysets
+# are only ever used as a base for further filters, never evaluated directly.
+_NON_ANONYMOUS_THREADS = CommentThread.objects.filter(
+    anonymous=False, anonymous_to_peers=False
+)
+_NON_ANONYMOUS_COMMENTS = Comment.objects.filter(
+    anonymous=False, anonymous_to_peers=False
+)
 
 
 class MySQLBackend(AbstractBackend):
@@ -51,38 +76,73 @@ class MySQLBackend(AbstractBackend):
     def update_stats_for_course(
         cls, user_id: str, course_id: str, **kwargs: Any
     ) -> None:
-        """Update stats for a course."""
-        user = User.objects.get(pk=user_id)
-        course_stat, created = CourseStat.objects.get_or_create(
-            user=user, course_id=course_id
-        )
-        if created:
-            course_stat.active_flags = 0
-            course_stat.inactive_flags = 0
-            course_stat.threads = 0
-            course_stat.responses = 0
-            course_stat.replies = 0
-
-        for key, value in kwargs.items():
-            if hasattr(course_stat, key):
-                setattr(course_stat, key, F(key) + value)
+        """
+        Update stats for a course.
 
-        course_stat.save()
+        The counters are incremented in place. The stats are only built from the
+        contents of the user when they don't exist yet.
+        """
+        updates: dict[str, Any] = {
+            key: F(key) + value
+            for key, value in kwargs.items()
+            if key in COURSE_STATS_COUNTERS
+        }
+        if any(kwargs.get(key, 0) > 0 for key in ("threads", "responses", "replies")):
+            updates["last_activity_at"] = timezone.now()
+        course_stats = CourseStat.objects.filter(user__pk=user_id, course_id=course_id)
+        if updates:
+            if course_stats.update(**updates):
+                invalidate_forum_user_cache(str(user_id))
+                return
+        elif course_stats.exists():
+            return
         cls.build_course_stats(user_id, course_id)
 
     @staticmethod
     def _get_entity_from_type(
-        entity_id: str, entity_type: str
+        entity_id: str, entity_type: str, only: tuple[str, ...] = ()
     ) -> Union[Comment, CommentThread, None]:
-        """Get entity from type."""
+        """
+        Get entity from type.
+
+        `only` restricts the loaded fields, so that callers that only need the id
+        or the course of the entity do not read its body.
+        """
+        model: type[Union[Comment, CommentThread]] = (
+            Comment if entity_type == "Comment" else CommentThread
+        )
+        queryset: QuerySet[Any] = model.objects.all()
+        if only:
+            queryset = queryset.only(*only)
         try:
-            if entity_type == "Comment":
-                return Comment.objects.get(pk=entity_id)
-            else:
-                return CommentThread.objects.get(pk=entity_id)
+            return queryset.get(pk=entity_id)
         except ObjectDoesNotExist:
             return None
 
+    @staticmethod
+    def _add_abuse_flaggers(
+        model: type[Union[AbuseFlagger, HistoricalAbuseFlagger]],
+        content: Union[Comment, CommentThread],
+        user_ids: Iterable[Union[int, str]],
+    ) -> None:
+        """
+        Add users to the (historical) abuse flaggers of a content, in a single insert.
+
+        Users who already flagged the content are skipped by the unique constraint.
+        """
+        model.objects.bulk_create(
+            [
+                model(
+                    user_id=int(user_id),
+                    content_type=content.content_type,
+                    content_object_id=content.pk,
+                )
+                for user_id in user_ids
+            ],
+            ignore_conflicts=True,
+            batch_size=1000,
+        )
+
     @classmethod
     def flag_as_abuse(
         cls, user_id: str, entity_id: str, **kwargs: Any
@@ -95,15 +155,22 @@ class MySQLBackend(AbstractBackend):
         if not entity:
             raise ValueError("Entity doesn't exist.")
 
-        abuse_flaggers = entity.abuse_flaggers
-        first_flag_added = False
-        if user.pk not in abuse_flaggers:
-            AbuseFlagger.objects.create(
-                user=user, content=entity, flagged_at=timezone.now()
-            )
-            first_flag_added = len(abuse_flaggers) == 1
-        if first_flag_added:
-            cls.update_stats_for_course(user_id, entity.course_id, active_flags=1)
+        abuse_flags = AbuseFlagger.objects.filter(
+            content_object_id=entity.pk, content_type=entity.content_type
+        )
+        _, created = AbuseFlagger.objects.get_or_create(
+            user=user,
+            content_object_id=entity.pk,
+            content_type=entity.content_type,
+            defaults={"flagged_at": timezone.now()},
+        )
+        if created:
+            entity.clear_cached_properties()
+            invalidate_search_threads_cache(course_id=entity.course_id)
+            if not abuse_flags.exclude(user=user).exists():
+                cls.update_stats_for_course(
+                    str(entity.author.pk), entity.course_id, active_flags=1
+                )
         return entity.to_dict()
 
     @classmethod
@@ -118,19 +185,23 @@ class MySQLBackend(AbstractBackend):
         if not entity:
             raise ValueError("Entity doesn't exist.")
 
-        has_no_historical_flags = len(entity.historical_abuse_flaggers) == 0
-        if user.pk in entity.abuse_flaggers:
-            AbuseFlagger.objects.filter(
-                user=user,
-                content_object_id=entity.pk,
-                content_type=entity.content_type,
-            ).delete()
+        has_no_historical_flags = not HistoricalAbuseFlagger.objects.filter(
+            content_object_id=entity.pk, content_type=entity.content_type
+        ).exists()
+        deleted, _ = AbuseFlagger.objects.filter(
+            user=user,
+            content_object_id=entity.pk,
+            content_type=entity.content_type,
+        ).delete()
+        if deleted:
             cls.update_stats_after_unflag(
                 entity.author.pk,
                 entity.pk,
                 has_no_historical_flags,
                 entity_type=entity.type,
             )
+            entity.clear_cached_properties()
+            invalidate_search_threads_cache(course_id=entity.course_id)
 
         return entity.to_dict()
 
@@ -143,25 +214,42 @@ class MySQLBackend(AbstractBackend):
         if not entity:
             raise ValueError("Entity doesn't exist.")
 
-        has_no_historical_flags = len(entity.historical_abuse_flaggers) == 0
-        historical_abuse_flaggers = list(
-            set(entity.historical_abuse_flaggers) | set(entity.abuse_flaggers)
+        content_filter = Q(
+            content_object_id=entity.pk, content_type=entity.content_type
         )
-        for flagger_id in historical_abuse_flaggers:
-            HistoricalAbuseFlagger.objects.create(
-                content=entity,
-                user=User.objects.get(pk=flagger_id),
-                flagged_at=timezone.now(),
+        flaggers = (
+            AbuseFlagger.objects.filter(content_filter)
+            .values_list("user_id", Value(False, output_field=BooleanField()))
+            .union(
+                HistoricalAbuseFlagger.objects.filter(content_filter).values_list(
+                    "user_id", Value(True, output_field=BooleanField())
+                ),
+                all=True,
             )
-        AbuseFlagger.objects.filter(
-            content_object_id=entity.pk, content_type=entity.content_type
-        ).delete()
+        )
+        abuse_flaggers: set[int] = set()
+        historical_abuse_flaggers: set[int] = set()
+        for flagger_id, historical in flaggers:
+            if historical:
+                historical_abuse_flaggers.add(flagger_id)
+            else:
+                abuse_flaggers.add(flagger_id)
+
+        has_no_historical_flags = not historical_abuse_flaggers
+        cls._add_abuse_flaggers(
+            HistoricalAbuseFlagger,
+            entity,
+            abuse_flaggers - historical_abuse_flaggers,
+        )
+        AbuseFlagger.objects.filter(content_filter).delete()
         cls.update_stats_after_unflag(
             entity.author.pk,
             entity.pk,
             has_no_historical_flags,
             entity_type=entity.type,
         )
+        entity.clear_cached_properties()
+        invalidate_search_threads_cache(course_id=entity.course_id)
 
         return entity.to_dict()
 
@@ -171,7 +259,7 @@ class MySQLBackend(AbstractBackend):
     ) -> None:
         """Update the stats for the course after unflagging an entity."""
         entity = cls._get_entity_from_type(
-            entity_id, entity_type=kwargs.get("entity_type", "")
+            entity_id, entity_type=kwargs.get("entity_type", ""), only=("course_id",)
         )
         if not entity:
             raise ObjectDoesNotExist
@@ -205,36 +293,47 @@ class MySQLBackend(AbstractBackend):
         """
         user = User.objects.get(pk=user_id)
         content = cls._get_entity_from_type(
-            content_id, entity_type=kwargs.get("entity_type", "")
+            content_id,
+            entity_type=kwargs.get("entity_type", ""),
+            only=("pk", "course_id"),
         )
         if not content:
             raise ValueError("Entity doesn't exist.")
 
-        votes = content.votes
-        user_vote = votes.filter(user__pk=user.pk).first()
-        if not is_deleted:
-            if vote_type not in ["up", "down"]:
-                raise ValueError("Invalid vote_type, use ('up' or 'down')")
-            if not user_vote:
-                vote = 1 if vote_type == "up" else -1
-                user_vote = UserVote.objects.create(
+        user_votes = UserVote.objects.filter(
+            user=user,
+            content_type=content.content_type,
+            content_object_id=content.pk,
+        )
+        if is_deleted:
+            deleted, _ = user_votes.delete()
+            if deleted:
+                invalidate_search_threads_cache(course_id=content.course_id)
+            return bool(deleted)
+
+        if vote_type not in ["up", "down"]:
+            raise ValueError("Invalid vote_type, use ('up' or 'down')")
+        # Insert the vote or overwrite the existing one in a single upsert. MySQL
+        # always upserts on the unique key and rejects an explicit target.
+        unique_fields = None
+        if connections[user_votes.db].features.supports_update_conflicts_with_target:
+            unique_fields = ["user", "content_type", "content_object_id"]
+        UserVote.objects.bulk_create(
+            [
+                UserVote(
                     user=user,
-                    content=content,
-                    vote=vote,
                     content_type=content.content_type,
+                    content_object_id=content.pk,
+                    vote=1 if vote_type == "up" else -1,
                 )
-            if vote_type == "up":
-                user_vote.vote = 1
-            else:
-                user_vote.vote = -1
-            user_vote.save()
-            return True
-        else:
-            if user_vote:
-                user_vote.delete()
-                return True
-
-        return False
+            ],
+            update_conflicts=True,
+            update_fields=["vote"],
+            unique_fields=unique_fields,
+        )
+        # bulk_create does not send post_save, which invalidates the cached searches.
+        invalidate_search_threads_cache(course_id=content.course_id)
+        return True
 
     @classmethod
     def upvote_content(cls, entity_id: str, user_id: str, **kwargs: Any) -> bool:
@@ -395,41 +494,25 @@ class MySQLBackend(AbstractBackend):
         Returns:
             dict[str, int]: A dictionary mapping thread IDs to their corresponding abuse-flagged comment count.
         """
-        abuse_flagger_count_subquery = (
-            AbuseFlagger.objects.filter(
-                content_type=ContentType.objects.get_for_model(Comment),
-                content_object_id=OuterRef("pk"),
-            )
-            .values("content_object_id")
-            .annotate(count=Count("pk"))
-            .values("count")
+        abuse_flags = AbuseFlagger.objects.filter(
+            content_type=ContentType.objects.get_for_model(Comment),
+            content_object_id=OuterRef("pk"),
         )
-
-        abuse_flagged_comments = (
-            Comment.objects.filter(
-                comment_thread__pk__in=thread_ids,
-            )
-            .annotate(
-                abuse_flaggers_count=Subquery(
-                    abuse_flagger_count_subquery, output_field=IntegerField()
-                )
-            )
-            .filter(abuse_flaggers_count__gt=0)
+        flagged_counts = (
+            Comment.objects.filter(comment_thread__pk__in=thread_ids)
+            .filter(Exists(abuse_flags))
+            .order_by()
+            .values("comment_thread")
+            .annotate(flagged_count=Count("pk"))
+            .values_list("comment_thread", "flagged_count")
         )
+        return {
+            str(thread_id): flagged_count for thread_id, flagged_count in flagged_counts
+        }
 
-        result = {}
-        for comment in abuse_flagged_comments:
-            thread_pk = str(comment.comment_thread.pk)
-            if thread_pk not in result:
-                result[thread_pk] = 0
-            abuse_flaggers = "abuse_flaggers_count"
-            result[thread_pk] += getattr(comment, abuse_flaggers)
-
-        return result
-
-    @staticmethod
+    @classmethod
     def get_read_states(
-        thread_ids: list[str], user_id: str, course_id: str
+        cls, thread_ids: list[str], user_id: str, course_id: str
     ) -> dict[str, list[Any]]:
         """
         Retrieves the read state and unread comment count for each thread in the provided list.
@@ -446,33 +529,32 @@ class MySQLBackend(AbstractBackend):
         read_states: dict[str, list[Any]] = {}
         if user_id == "":
             return read_states
-        try:
-            user = User.objects.get(pk=user_id)
-        except User.DoesNotExist:
-            return read_states
-
-        threads = CommentThread.objects.filter(pk__in=thread_ids)
-        read_state = ReadState.objects.filter(user=user, course_id=course_id).first()
-        if not read_state:
-            return read_states
-
-        read_dates = read_state.last_read_times
-
-        for thread in threads:
-            read_date = read_dates.filter(comment_thread=thread).first()
-            if not read_date:
-                continue
 
-            last_activity_at = thread.last_activity_at
-            is_read = read_date.timestamp >= last_activity_at
-            unread_comment_count = (
-                Comment.objects.filter(
-                    comment_thread=thread, created_at__gte=read_date.timestamp
+        unread_comments = Comment.objects.filter(
+            comment_thread=OuterRef("comment_thread"),
+            created_at__gte=OuterRef("timestamp"),
+        ).exclude(author__pk=user_id)
+        read_dates = (
+            LastReadTime.objects.filter(
+                read_state__user__pk=user_id,
+                read_state__course_id=course_id,
+                comment_thread__pk__in=thread_ids,
+            )
+            .annotate(
+                unread_comment_count=cls._count_subquery(
+                    unread_comments, "comment_thread"
                 )
-                .exclude(author__pk=user_id)
-                .count()
             )
-            read_states[str(thread.pk)] = [is_read, unread_comment_count]
+            .values_list(
+                "comment_thread_id",
+                "timestamp",
+                "comment_thread__last_activity_at",
+                "unread_comment_count",
+            )
+        )
+        for thread_id, timestamp, last_activity_at, unread_comment_count in read_dates:
+            is_read = timestamp >= last_activity_at
+            read_states[str(thread_id)] = [is_read, unread_comment_count]
 
         return read_states
 
@@ -518,11 +600,11 @@ class MySQLBackend(AbstractBackend):
         Returns:
             dict[str, bool]: A dictionary of thread IDs to their endorsed status (True if endorsed, False otherwise).
         """
-        endorsed_comments = Comment.objects.filter(
+        endorsed_thread_ids = Comment.objects.filter(
             comment_thread__pk__in=thread_ids, endorsed=True
-        )
+        ).values_list("comment_thread_id", flat=True)
 
-        return {str(comment.comment_thread.pk): True for comment in endorsed_comments}
+        return {str(thread_id): True for thread_id in endorsed_thread_ids}
 
     @staticmethod
     def get_user_read_state_by_course_id(
@@ -733,7 +815,10 @@ class MySQLBackend(AbstractBackend):
         if raw_query:
             return {
                 "result": [
-                    comment_thread.to_dict() for comment_thread in comment_threads
+                    comment_thread.to_dict()
+                    for comment_thread in CommentThread.with_serializable(
+                        comment_threads
+                    )
                 ]
             }
 
@@ -746,27 +831,27 @@ class MySQLBackend(AbstractBackend):
             to_skip = (page - 1) * per_page
             has_more = False
 
-            for thread in comment_threads.iterator():
-                thread_key = str(thread.pk)
+            for thread_pk, last_activity_at in comment_threads.values_list(
+                "pk", "last_activity_at"
+            ).iterator():
+                thread_key = str(thread_pk)
                 if (
                     thread_key not in read_dates
-                    or read_dates[thread_key] < thread.last_activity_at
+                    or read_dates[thread_key] < last_activity_at
                 ):
                     if skipped >= to_skip:
                         if len(threads) == per_page:
                             has_more = True
                             break
-                        threads.append(thread.pk)
+                        threads.append(thread_pk)
                     else:
                         skipped += 1
             num_pages = page + 1 if has_more else page
         else:
-            threads = [thread.pk for thread in comment_threads]
             page = max(1, page)
             start = per_page * (page - 1)
             end = per_page * page
-            paginated_collection = threads[start:end]
-            threads = list(paginated_collection)
+            threads = list(comment_threads.values_list("pk", flat=True)[start:end])
             num_pages = max(1, math.ceil(thread_count / per_page))
 
         if len(threads) == 0:
@@ -785,7 +870,7 @@ class MySQLBackend(AbstractBackend):
 
     @staticmethod
     def prepare_thread(
-        thread_id: str,
+        thread: dict[str, Any],
         is_read: bool,
         unread_count: int,
         is_endorsed: bool,
@@ -804,9 +889,8 @@ class MySQLBackend(AbstractBackend):
         Returns:
             dict[str, Any]: A dictionary representing the prepared thread data.
         """
-        thread = CommentThread.objects.get(pk=thread_id)
         return {
-            **thread.to_dict(),
+            **thread,
             "type": "thread",
             "read": is_read,
             "unread_comments_count": unread_count,
@@ -834,24 +918,28 @@ class MySQLBackend(AbstractBackend):
         Returns:
             list[dict[str, Any]]: A list of prepared thread data.
         """
-        threads = CommentThread.objects.filter(pk__in=thread_ids)
+        threads = CommentThread.with_serializable().filter(pk__in=thread_ids)
         read_states = cls.get_read_states(thread_ids, user_id, course_id)
         threads_endorsed = cls.get_endorsed(thread_ids)
         threads_flagged = (
             cls.get_abuse_flagged_count(thread_ids) if count_flagged else {}
         )
+        threads_dict = {str(thread.pk): thread.to_dict() for thread in threads}
 
         presenters = []
         for thread_id in thread_ids:
-            thread = threads.get(id=thread_id)
+            thread_key = str(thread_id)
+            thread = threads_dict.get(thread_key)
+            if not thread:
+                continue
             is_read, unread_count = read_states.get(
-                thread.pk, (False, thread.comment_count)
+                thread_key, (False, thread["comment_count"])
             )
-            is_endorsed = threads_endorsed.get(thread.pk, False)
-            abuse_flagged_count = threads_flagged.get(str(thread.pk), 0)
+            is_endorsed = threads_endorsed.get(thread_key, False)
+            abuse_flagged_count = threads_flagged.get(thread_key, 0)
             presenters.append(
                 cls.prepare_thread(
-                    thread.pk,
+                    thread,
                     is_read,
                     unread_count,
                     is_endorsed,
@@ -880,13 +968,16 @@ class MySQLBackend(AbstractBackend):
         return user.username
 
     @staticmethod
-    def validate_object(model: str, obj_id: str) -> Any:
+    def validate_object(
+        model: str, obj_id: str, projection: Optional[dict[str, Any]] = None
+    ) -> Any:
         """
         Validates the object if it exists or not.
 
         Parameters:
             model: The model for which to validate the id.
             id: The ID of the object to validate in the model.
+            projection: The fields to return, all of them if not provided.
         Response:
             raise exception if object does not exists.
             return object
@@ -896,6 +987,13 @@ class MySQLBackend(AbstractBackend):
             "Comment": Comment,
         }
 
+        if projection is not None:
+            fields = [field for field in projection if field != "_id"]
+            values = modelss[model].objects.filter(pk=int(obj_id)).values("pk", *fields)
+            if not (row := values.first()):
+                raise ObjectDoesNotExist
+            return {"_id": str(row.pop("pk")), **row}
+
         try:
             instance = modelss[model].objects.get(pk=int(obj_id))
         except ObjectDoesNotExist as exc:
@@ -921,25 +1019,19 @@ class MySQLBackend(AbstractBackend):
             subscriber__pk=user_id,
             source_content_type=ContentType.objects.get_for_model(CommentThread),
         )
-        thread_ids = [
-            str(subscription.source_object_id) for subscription in subscriptions
-        ]
         if course_id:
-            thread_ids = list(
-                CommentThread.objects.filter(
-                    pk__in=thread_ids,
-                    course_id=course_id,
-                ).values_list("pk", flat=True)
-            )
-
-        return thread_ids
+            subscriptions = subscriptions.filter(course_id=course_id)
+        return [
+            str(thread_id)
+            for thread_id in subscriptions.values_list("source_object_id", flat=True)
+        ]
 
     @classmethod
     def subscribe_user(
         cls, user_id: str, source_id: str, source_type: str
     ) -> dict[str, Any] | None:
         """Subscribe a user to a source."""
-        source = cls._get_entity_from_type(source_id, source_type)
+        source = cls._get_entity_from_type(source_id, source_type, only=("course_id",))
         if source is None:
             return None
 
@@ -947,6 +1039,7 @@ class MySQLBackend(AbstractBackend):
             subscriber=User.objects.get(pk=int(user_id)),
             source_object_id=source.pk,
             source_content_type=source.content_type,
+            defaults={"course_id": source.course_id},
         )
         return subscription.to_dict()
 
@@ -955,7 +1048,7 @@ class MySQLBackend(AbstractBackend):
         cls, user_id: str, source_id: str, source_type: Optional[str] = ""
     ) -> None:
         """Unsubscribe a user from a source."""
-        source = cls._get_entity_from_type(source_id, source_type or "")
+        source = cls._get_entity_from_type(source_id, source_type or "", only=("pk",))
         if source is None:
             return
 
@@ -973,7 +1066,7 @@ class MySQLBackend(AbstractBackend):
     @classmethod
     def delete_subscriptions_of_a_thread(cls, thread_id: str) -> None:
         """Delete subscriptions of a thread."""
-        source = cls._get_entity_from_type(thread_id, "CommentThread")
+        source = cls._get_entity_from_type(thread_id, "CommentThread", only=("pk",))
         if source is None:
             return
 
@@ -1091,16 +1184,33 @@ class MySQLBackend(AbstractBackend):
         ).values_list("content_object_id", flat=True)
         return list(voted_ids)
 
+    @staticmethod
+    def _get_user_voted_ids_by_vote(user_id: str) -> dict[str, list[str]]:
+        """Get the IDs of the posts up and down voted by a user, in a single query."""
+        voted_ids: dict[str, list[str]] = {"up": [], "down": []}
+        for content_object_id, vote in UserVote.objects.filter(
+            user__pk=user_id, vote__in=(1, -1)
+        ).values_list("content_object_id", "vote"):
+            voted_ids["up" if vote == 1 else "down"].append(content_object_id)
+        return voted_ids
+
     @staticmethod
     def filter_standalone_threads(comment_ids: list[str]) -> list[str]:
         """Filter out standalone threads from the list of threads."""
-        comments = Comment.objects.filter(pk__in=comment_ids)
-        filtered_threads = [
-            comment.comment_thread
-            for comment in comments
-            if comment.comment_thread.context != "standalone"
-        ]
-        return [str(thread.pk) for thread in filtered_threads]
+        thread_ids = (
+            Comment.objects.filter(pk__in=comment_ids)
+            .exclude(comment_thread__context="standalone")
+            .values_list("comment_thread_id", flat=True)
+        )
+        return [str(thread_id) for thread_id in thread_ids]
+
+    @staticmethod
+    def _count_subquery(queryset: QuerySet[Any], group_by: str) -> Coalesce:
+        """Return a subquery that counts the rows of a queryset filtered on OuterRef."""
+        counts = queryset.order_by().values(group_by).annotate(count=Count("pk"))
+        return Coalesce(
+            Subquery(counts.values("count"), output_field=IntegerField()), 0
+        )
 
     @classmethod
     def user_to_hash(
@@ -1109,21 +1219,41 @@ class MySQLBackend(AbstractBackend):
         """
         Converts user data to a hash
         """
-        user = User.objects.get(pk=user_id)
-        forum_user = ForumUser.objects.get(user__pk=user_id)
         if params is None:
             params = {}
 
-        user_data = forum_user.to_dict()
+        forum_users = ForumUser.objects.select_related("user").filter(user__pk=user_id)
+        if params.get("course_id"):
+            # Count the posts of the user in the same query that fetches the user.
+            threads = _NON_ANONYMOUS_THREADS.filter(
+                author=OuterRef("user"), course_id=params["course_id"]
+            )
+            comments = _NON_ANONYMOUS_COMMENTS.filter(
+                author=OuterRef("user"), course_id=params["course_id"]
+            ).exclude(comment_thread__context="standalone")
+            if params.get("group_ids"):
+                threads = threads.filter(
+                    Q(group_id__in=params["group_ids"]) | Q(group_id__isnull=True)
+                )
+                comments = comments.filter(
+                    Q(comment_thread__group_id__in=params["group_ids"])
+                    | Q(comment_thread__group_id__isnull=True)
+                )
+            forum_users = forum_users.annotate(
+                threads_count=cls._count_subquery(threads, "author"),
+                comments_count=cls._count_subquery(comments, "author"),
+            )
+        forum_user = forum_users.get()
+        user = forum_user.user
+
         hash_data = {}
-        hash_data["username"] = user_data["username"]
-        hash_data["external_id"] = user_data["external_id"]
-        hash_data["id"] = user_data["external_id"]
+        hash_data["username"] = user.username
+        hash_data["external_id"] = user.pk
+        hash_data["id"] = user.pk
 
         if params.get("complete"):
             subscribed_thread_ids = cls.find_subscribed_threads(user_id)
-            upvoted_ids = cls.get_user_voted_ids(user_id, "up")
-            downvoted_ids = cls.get_user_voted_ids(user_id, "down")
+            voted_ids = cls._get_user_voted_ids_by_vote(user_id)
             hash_data.update(
                 {
                     "subscribed_thread_ids": subscribed_thread_ids,
@@ -1131,55 +1261,17 @@ class MySQLBackend(AbstractBackend):
                     "subscribed_user_ids": [],
                     "follower_ids": [],
                     "id": user_id,
-                    "upvoted_ids": upvoted_ids,
-                    "downvoted_ids": downvoted_ids,
-                    "default_sort_key": user_data["default_sort_key"],
+                    "upvoted_ids": voted_ids["up"],
+                    "downvoted_ids": voted_ids["down"],
+                    "default_sort_key": forum_user.default_sort_key,
                 }
             )
 
         if params.get("course_id"):
-            threads = CommentThread.objects.filter(
-                author=user,
-                course_id=params["course_id"],
-                anonymous=False,
-                anonymous_to_peers=False,
-            )
-            comments = Comment.objects.filter(
-                author=user,
-                course_id=params["course_id"],
-                anonymous=False,
-                anonymous_to_peers=False,
-            )
-            comment_ids = list(comments.values_list("pk", flat=True))
-            if params.get("group_ids"):
-                group_threads = threads.filter(
-                    group_id__in=params["group_ids"] + [None]
-                )
-                group_thread_ids = [str(thread.pk) for thread in group_threads]
-                threads_count = len(group_thread_ids)
-                comment_thread_ids = cls.filter_standalone_threads(comment_ids)
-
-                group_comment_threads = CommentThread.objects.filter(
-                    id__in=comment_thread_ids, group_id__in=params["group_ids"] + [None]
-                )
-                group_comment_thread_ids = [
-                    str(thread.pk) for thread in group_comment_threads
-                ]
-                comments_count = sum(
-                    1
-                    for comment_thread_id in comment_thread_ids
-                    if comment_thread_id in group_comment_thread_ids
-                )
-            else:
-                thread_ids = [str(thread.pk) for thread in threads]
-                threads_count = len(thread_ids)
-                comment_thread_ids = cls.filter_standalone_threads(comment_ids)
-                comments_count = len(comment_thread_ids)
-
             hash_data.update(
                 {
-                    "threads_count": threads_count,
-                    "comments_count": comments_count,
+                    "threads_count": getattr(forum_user, "threads_count"),
+                    "comments_count": getattr(forum_user, "comments_count"),
                 }
             )
 
@@ -1206,12 +1298,15 @@ class MySQLBackend(AbstractBackend):
         user_id: str, username: str
     ) -> None:  # pylint: disable=W0613
         """Retire all content from user."""
-        comments = Comment.objects.filter(author__pk=user_id)
+        # The retired fields are overwritten, so there is no need to load them.
+        comments = Comment.objects.filter(author__pk=user_id).defer("body")
         for comment in comments:
             comment.body = RETIRED_BODY
             comment.save()
 
-        comment_threads = CommentThread.objects.filter(author__pk=user_id)
+        comment_threads = CommentThread.objects.filter(author__pk=user_id).defer(
+            "body", "title"
+        )
         for comment_thread in comment_threads:
             comment_thread.body = RETIRED_BODY
             comment_thread.title = RETIRED_TITLE
@@ -1247,6 +1342,7 @@ class MySQLBackend(AbstractBackend):
                 "timestamp": timezone.now(),
             },
         )
+        invalidate_search_threads_cache(user_id=str(user.pk))
 
     @staticmethod
     def find_or_create_user_stats(user_id: str, course_id: str) -> dict[str, Any]:
@@ -1285,99 +1381,82 @@ class MySQLBackend(AbstractBackend):
     @classmethod
     def build_course_stats(cls, author_id: str, course_id: str) -> None:
         """Build course stats."""
-        author = User.objects.get(pk=author_id)
-        threads = CommentThread.objects.filter(
-            author=author,
-            course_id=course_id,
-            anonymous_to_peers=False,
-            anonymous=False,
+        threads = _NON_ANONYMOUS_THREADS.filter(
+            author__pk=author_id, course_id=course_id
         )
-        comments = Comment.objects.filter(
-            author=author,
-            course_id=course_id,
-            anonymous_to_peers=False,
-            anonymous=False,
+        comments = _NON_ANONYMOUS_COMMENTS.filter(
+            author__pk=author_id, course_id=course_id
         )
 
-        responses = comments.filter(parent__isnull=True)
-        replies = comments.filter(parent__isnull=False)
-
-        comment_ids = [comment.pk for comment in comments]
-        threads_ids = [thread.pk for thread in threads]
-
-        active_flags_comments = (
-            AbuseFlagger.objects.filter(
-                content_object_id__in=comment_ids, content_type=Comment().content_type
-            )
-            .values("content_object_id")
-            .annotate(count=Count("content_object_id"))
-            .count()
+        thread_stats = threads.aggregate(
+            threads=Count("pk"),
+            **cls._flags_aggregates(CommentThread),
+            updated_at=Max("updated_at"),
         )
-
-        active_flags_threads = (
-            AbuseFlagger.objects.filter(
-                content_object_id__in=threads_ids,
-                content_type=CommentThread().content_type,
-            )
-            .values("content_object_id")
-            .annotate(count=Count("content_object_id"))
-            .count()
+        comment_stats = comments.aggregate(
+            responses=Count("pk", filter=Q(parent__isnull=True)),
+            replies=Count("pk", filter=Q(parent__isnull=False)),
+            **cls._flags_aggregates(Comment),
+            updated_at=Max("updated_at"),
         )
 
-        active_flags = active_flags_comments + active_flags_threads
-
-        inactive_flags_comments = (
-            HistoricalAbuseFlagger.objects.filter(
-                content_object_id__in=comment_ids, content_type=Comment().content_type
-            )
-            .values("content_object_id")
-            .annotate(count=Count("content_object_id"))
-            .count()
+        updated_at = max(
+            thread_stats["updated_at"] or timezone.now() - timedelta(days=365 * 100),
+            comment_stats["updated_at"] or timezone.now() - timedelta(days=365 * 100),
         )
 
-        inactive_flags_threads = (
-            HistoricalAbuseFlagger.objects.filter(
-                content_object_id__in=threads_ids,
-                content_type=CommentThread().content_type,
+        stats = {
+            "threads": thread_stats["threads"],
+            "responses": comment_stats["responses"],
+            "replies": comment_stats["replies"],
+            "active_flags": thread_stats["active_flags"]
+            + comment_stats["active_flags"],
+            "inactive_flags": (
+                thread_stats["inactive_flags"] + comment_stats["inactive_flags"]
+            ),
+            "last_activity_at": updated_at,
+        }
+        # Overwrite the existing stats in one UPDATE, which sends no post_save.
+        if CourseStat.objects.filter(user__pk=author_id, course_id=course_id).update(
+            **stats
+        ):
+            invalidate_forum_user_cache(str(author_id))
+        else:
+            CourseStat.objects.update_or_create(
+                user_id=int(author_id), course_id=course_id, defaults=stats
             )
-            .values("content_object_id")
-            .annotate(count=Count("content_object_id"))
-            .count()
-        )
-
-        inactive_flags = inactive_flags_comments + inactive_flags_threads
-
-        threads_updated_at = threads.aggregate(Max("updated_at"))["updated_at__max"]
-        comments_updated_at = comments.aggregate(Max("updated_at"))["updated_at__max"]
-
-        updated_at = max(
-            threads_updated_at or timezone.now() - timedelta(days=365 * 100),
-            comments_updated_at or timezone.now() - timedelta(days=365 * 100),
-        )
 
-        stats, _ = CourseStat.objects.get_or_create(user=author, course_id=course_id)
-        stats.threads = threads.count()
-        stats.responses = responses.count()
-        stats.replies = replies.count()
-        stats.active_flags = active_flags
-        stats.inactive_flags = inactive_flags
-        stats.last_activity_at = updated_at
-        stats.save()
-        cls.update_user_stats_for_course(author_id, stats.to_dict())
+    @staticmethod
+    def _flags_aggregates(model: type[Content]) -> dict[str, Count]:
+        """
+        Return the aggregates counting the contents that are flagged, currently
+        (active_flags) or in the past (inactive_flags).
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        return {
+            "active_flags": Count(
+                "pk",
+                filter=Exists(
+                    AbuseFlagger.objects.filter(
+                        content_type=content_type, content_object_id=OuterRef("pk")
+                    )
+                ),
+            ),
+            "inactive_flags": Count(
+                "pk",
+                filter=Exists(
+                    HistoricalAbuseFlagger.objects.filter(
+                        content_type=content_type, content_object_id=OuterRef("pk")
+                    )
+                ),
+            ),
+        }
 
     @classmethod
     def update_all_users_in_course(cls, course_id: str) -> list[str]:
         """Update all user stats in a course."""
-        course_comments = Comment.objects.filter(
-            anonymous=False,
-            anonymous_to_peers=False,
-            course_id=course_id,
-        )
-        course_threads = CommentThread.objects.filter(
-            anonymous=False,
-            anonymous_to_peers=False,
-            course_id=course_id,
-        )
+        course_comments = _NON_ANONYMOUS_COMMENTS.filter(course_id=course_id)
+        course_threads = _NON_ANONYMOUS_THREADS.filter(course_id=course_id)
 
         comment_authors = set(course_comments.values_list("author__id", flat=True))
         thread_authors = set(course_threads.values_list("author__id", flat=True))
@@ -1496,8 +1575,8 @@ class MySQLBackend(AbstractBackend):
     def delete_comment(cls, comment_id: str) -> None:
         """Delete comment from comment_id."""
         comment = Comment.objects.get(pk=comment_id)
-        if comment.parent:
-            cls.update_child_count_in_parent_comment(str(comment.parent.pk), -1)
+        if comment.parent_id:
+            cls.update_child_count_in_parent_comment(str(comment.parent_id), -1)
 
         comment.delete()
 
@@ -1532,8 +1611,8 @@ class MySQLBackend(AbstractBackend):
             }
         return commentable_counts
 
-    @staticmethod
-    def update_comment(comment_id: str, **kwargs: Any) -> int:
+    @classmethod
+    def update_comment(cls, comment_id: str, **kwargs: Any) -> int:
         """Updates a comment in the database."""
         try:
             comment = Comment.objects.get(id=comment_id)
@@ -1572,44 +1651,11 @@ class MySQLBackend(AbstractBackend):
             comment.endorsement = {}
 
         if "abuse_flaggers" in kwargs:
-            existing_abuse_flaggers = AbuseFlagger.objects.filter(
-                content_object_id=comment.pk,
-                content_type=comment.content_type,
-            ).values_list("user_id", flat=True)
-
-            new_abuse_flaggers = [
-                int(user_id)
-                for user_id in kwargs["abuse_flaggers"]
-                if int(user_id) not in existing_abuse_flaggers
-            ]
-
-            for user_id in new_abuse_flaggers:
-                AbuseFlagger.objects.create(
-                    user=User.objects.get(pk=user_id),
-                    content_object_id=comment.pk,
-                    content_type=comment.content_type,
-                )
+            cls._add_abuse_flaggers(AbuseFlagger, comment, kwargs["abuse_flaggers"])
 
         if "historical_abuse_flaggers" in kwargs:
-            existing_historical_abuse_flaggers = HistoricalAbuseFlagger.objects.filter(
-                content_object_id=comment.pk,
-                content_type=comment.content_type,
-            ).values_list("user_id", flat=True)
-
-            new_historical_abuse_flaggers = [
-                int(user_id)
-                for user_id in kwargs["historical_abuse_flaggers"]
-                if int(user_id) not in existing_historical_abuse_flaggers
-            ]
-            HistoricalAbuseFlagger.objects.bulk_create(
-                [
-                    HistoricalAbuseFlagger(
-                        user=User.objects.get(pk=user_id),
-                        content_object_id=comment.pk,
-                        content_type=comment.content_type,
-                    )
-                    for user_id in new_historical_abuse_flaggers
-                ]
+            cls._add_abuse_flaggers(
+                HistoricalAbuseFlagger, comment, kwargs["historical_abuse_flaggers"]
             )
 
         if kwargs.get("editing_user_id"):
@@ -1681,7 +1727,9 @@ class MySQLBackend(AbstractBackend):
     def get_thread(thread_id: str) -> dict[str, Any] | None:
         """Return thread from thread_id."""
         try:
-            thread = CommentThread.objects.get(pk=thread_id)
+            thread = CommentThread.objects.select_related("author", "closed_by").get(
+                pk=thread_id
+            )
         except CommentThread.DoesNotExist:
             return None
         return thread.to_dict()
@@ -1692,7 +1740,7 @@ class MySQLBackend(AbstractBackend):
     ) -> dict[str, Any] | None:
         """Return subscription from subscriber_id and source_id."""
         source = cls._get_entity_from_type(
-            source_id, entity_type=kwargs.get("source_type", "")
+            source_id, entity_type=kwargs.get("source_type", ""), only=("pk",)
         )
         if not source:
             return None
@@ -1710,7 +1758,9 @@ class MySQLBackend(AbstractBackend):
     def get_subscriptions(cls, query: dict[str, Any]) -> list[dict[str, Any]]:
         """Return subscriptions from filter."""
         source = cls._get_entity_from_type(
-            entity_id=query["source_id"], entity_type=query.get("source_type", "")
+            entity_id=query["source_id"],
+            entity_type=query.get("source_type", ""),
+            only=("pk",),
         )
         if not source:
             return []
@@ -1757,13 +1807,19 @@ class MySQLBackend(AbstractBackend):
         )
         return str(new_thread.pk)
 
-    @staticmethod
+    @classmethod
     def update_thread(
+        cls,
         thread_id: str,
         **kwargs: Any,
     ) -> int:
         """Updates a thread document in the database."""
         thread = CommentThread.objects.get(id=thread_id)
+        previous_course_id = thread.course_id
+        commentables_counts_changed = any(
+            field in kwargs and kwargs[field] != getattr(thread, field)
+            for field in COMMENTABLES_COUNTS_FIELDS
+        )
 
         if "thread_type" in kwargs:
             thread.thread_type = kwargs["thread_type"]
@@ -1773,6 +1829,10 @@ class MySQLBackend(AbstractBackend):
             thread.body = kwargs["body"]
         if "course_id" in kwargs:
             thread.course_id = kwargs["course_id"]
+            Subscription.objects.filter(
+                source_object_id=thread.pk,
+                source_content_type=thread.content_type,
+            ).update(course_id=kwargs["course_id"])
         if "anonymous" in kwargs:
             thread.anonymous = kwargs["anonymous"]
         if "anonymous_to_peers" in kwargs:
@@ -1797,45 +1857,11 @@ class MySQLBackend(AbstractBackend):
         if "group_id" in kwargs:
             thread.group_id = kwargs["group_id"]
         if "abuse_flaggers" in kwargs:
-            existing_abuse_flaggers = AbuseFlagger.objects.filter(
-                content_object_id=thread.pk,
-                content_type=thread.content_type,
-            ).values_list("user_id", flat=True)
-
-            new_abuse_flaggers = [
-                int(user_id)
-                for user_id in kwargs["abuse_flaggers"]
-                if int(user_id) not in existing_abuse_flaggers
-            ]
-
-            for user_id in new_abuse_flaggers:
-                AbuseFlagger.objects.create(
-                    user=User.objects.get(pk=user_id),
-                    content_object_id=thread.pk,
-                    content_type=thread.content_type,
-                )
+            cls._add_abuse_flaggers(AbuseFlagger, thread, kwargs["abuse_flaggers"])
 
         if "historical_abuse_flaggers" in kwargs:
-            existing_historical_abuse_flaggers = HistoricalAbuseFlagger.objects.filter(
-                content_object_id=thread.pk,
-                content_type=thread.content_type,
-            ).values_list("user__pk", flat=True)
-
-            new_historical_abuse_flaggers = [
-                int(user_id)
-                for user_id in kwargs["historical_abuse_flaggers"]
-                if int(user_id) not in existing_historical_abuse_flaggers
-            ]
-
-            HistoricalAbuseFlagger.objects.bulk_create(
-                [
-                    HistoricalAbuseFlagger(
-                        user=User.objects.get(pk=user_id),
-                        content_object_id=thread.pk,
-                        content_type=thread.content_type,
-                    )
-                    for user_id in new_historical_abuse_flaggers
-                ]
+            cls._add_abuse_flaggers(
+                HistoricalAbuseFlagger, thread, kwargs["historical_abuse_flaggers"]
             )
 
         if "editing_user_id" in kwargs and kwargs["editing_user_id"]:
@@ -1868,6 +1894,9 @@ class MySQLBackend(AbstractBackend):
 
         thread.updated_at = timezone.now()
         thread.save()
+        if commentables_counts_changed:
+            invalidate_commentables_counts(previous_course_id)
+            invalidate_commentables_counts(thread.course_id)
         return 1
 
     @staticmethod
@@ -1878,7 +1907,7 @@ class MySQLBackend(AbstractBackend):
     @staticmethod
     def get_filtered_threads(query: dict[str, Any]) -> list[dict[str, Any]]:
         """Return a list of threads that match the given filter."""
-        threads = CommentThread.objects.filter(**query)
+        threads = CommentThread.with_serializable().filter(**query)
         return [thread.to_dict() for thread in threads]
 
     @staticmethod
@@ -1925,11 +1954,14 @@ class MySQLBackend(AbstractBackend):
         """
         The thread Id from the parent comment.
         """
-        try:
-            comment = Comment.objects.get(pk=parent_comment_id)
-        except ObjectDoesNotExist as exc:
-            raise ValueError("comment does not exist.") from exc
-        return comment.comment_thread.pk
+        thread_id = (
+            Comment.objects.filter(pk=parent_comment_id)
+            .values_list("comment_thread_id", flat=True)
+            .first()
+        )
+        if thread_id is None:
+            raise ValueError("comment does not exist.")
+        return str(thread_id)
 
     @staticmethod
     def update_comment_and_get_updated_comment(
@@ -1969,25 +2001,36 @@ class MySQLBackend(AbstractBackend):
             return None
 
         original_body = comment.body
+        # Only write the fields of this update, so that concurrent updates of other
+        # fields are not overwritten with the values read above.
+        update_fields = ["updated_at"]
         if body:
             comment.body = body
+            update_fields.append("body")
         if course_id:
             comment.course_id = course_id
+            update_fields.append("course_id")
         if user_id:
             comment.author = User.objects.get(pk=user_id)
+            update_fields.append("author")
         if anonymous is not None:
             comment.anonymous = anonymous
+            update_fields.append("anonymous")
         if anonymous_to_peers is not None:
             comment.anonymous_to_peers = anonymous_to_peers
+            update_fields.append("anonymous_to_peers")
         if endorsed is not None:
             comment.endorsed = endorsed
+            update_fields.append("endorsed")
             if endorsed is False:
                 comment.endorsement = {}
+                update_fields.append("endorsement")
             if endorsement_user_id:
                 comment.endorsement = {
                     "user_id": endorsement_user_id,
                     "time": str(timezone.now()),
                 }
+                update_fields.append("endorsement")
 
         if editing_user_id:
             EditHistory.objects.create(
@@ -2000,7 +2043,7 @@ class MySQLBackend(AbstractBackend):
             )
 
         comment.updated_at = timezone.now()
-        comment.save()
+        comment.save(update_fields=update_fields)
         return comment.to_dict()
 
     @staticmethod
@@ -2039,8 +2082,9 @@ class MySQLBackend(AbstractBackend):
         if sort_key:
             forum_users = forum_users.order_by(sort_key)
 
-        result = [user.to_dict() for user in forum_users]
-        return result
+        return ForumUser.bulk_to_dict(
+            list(forum_users.values_list("user_id", flat=True))
+        )
 
     @staticmethod
     def get_user_sort_criterion(sort_by: str) -> dict[str, Any]:
@@ -2085,13 +2129,10 @@ class MySQLBackend(AbstractBackend):
         paginator = Paginator(users, per_page)
         paginated_users = paginator.page(page)
 
-        forum_users = [
-            ForumUser.objects.get(user_id=user_id)
-            for user_id in paginated_users.object_list
-        ]
+        user_ids = [user.pk for user in paginated_users.object_list]
         return {
             "pagination": [{"total_count": paginator.count}],
-            "data": [user.to_dict(course_id=course_id) for user in forum_users],
+            "data": ForumUser.bulk_to_dict(user_ids, course_id=course_id),
         }
 
     @staticmethod
@@ -2162,9 +2203,11 @@ class MySQLBackend(AbstractBackend):
         """
         contents = [
             comment.to_dict()
-            for comment in Comment.objects.filter(author__username=username)
+            for comment in Comment.with_serializable().filter(author__username=username)
         ] + [
             thread.to_dict()
-            for thread in CommentThread.objects.filter(author__username=username)
+            for thread in CommentThread.with_serializable().filter(
+                author__username=username
+            )
         ]
         return contents
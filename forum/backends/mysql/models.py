@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Optional
+from functools import cached_property
+from typing import Any, Iterable, Iterator, Optional
 
 from django.contrib.auth.models import User  # pylint: disable=E5142
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
-from django.db.models import QuerySet
+from django.core.cache import cache
+from django.db import connections, models
+from django.db.models import F, Prefetch, QuerySet, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from forum.utils import validate_upvote_or_downvote
+from forum.constants import FORUM_USER_CACHE_TIMEOUT
+from forum.utils import get_forum_user_cache_key, validate_upvote_or_downvote
 
 
 class ForumUser(models.Model):
@@ -25,19 +30,96 @@ class ForumUser(models.Model):
     user: models.OneToOneField[User, User] = models.OneToOneField(
         User, related_name="forum", on_delete=models.CASCADE
     )
+    user_id: int
     default_sort_key: models.CharField[str, str] = models.CharField(
         max_length=25, default="date"
     )
 
     def to_dict(self, course_id: Optional[str] = None) -> dict[str, Any]:
-        """Return a dictionary representation of the model."""
-        course_stats = CourseStat.objects.filter(user=self.user)
-        read_states = ReadState.objects.filter(user=self.user)
+        """
+        Return a dictionary representation of the model.
+
+        The result is cached until the user, their course stats or their read
+        states change.
+        """
+        cache_key = get_forum_user_cache_key(str(self.user_id), course_id)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._to_dict(course_id)
+            cache.set(cache_key, data, timeout=FORUM_USER_CACHE_TIMEOUT)
+        return data
+
+    @classmethod
+    def bulk_to_dict(
+        cls, user_ids: list[int], course_id: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return the dictionary representations of several users, in the given order.
+
+        The users missing from the cache are read together with their course stats
+        and read states, in a fixed number of queries. Ids without a forum user are
+        skipped.
+        """
+        cache_keys = {
+            user_id: get_forum_user_cache_key(str(user_id), course_id)
+            for user_id in user_ids
+        }
+        data = cache.get_many(list(cache_keys.values()))
+        missing_user_ids = [
+            user_id for user_id, key in cache_keys.items() if key not in data
+        ]
+        if missing_user_ids:
+            course_stats: dict[int, list[CourseStat]] = defaultdict(list)
+            for course_stat in CourseStat.objects.filter(user__pk__in=missing_user_ids):
+                course_stats[course_stat.user_id].append(course_stat)
+            read_states: dict[int, list[ReadState]] = defaultdict(list)
+            for read_state in ReadState.objects.filter(
+                user__pk__in=missing_user_ids
+            ).prefetch_related("last_read_times"):
+                read_states[read_state.user_id].append(read_state)
+            missing_data = {
+                cache_keys[forum_user.user_id]: forum_user._to_dict(
+                    course_id,
+                    course_stats[forum_user.user_id],
+                    read_states[forum_user.user_id],
+                )
+                for forum_user in cls.objects.filter(
+                    user__pk__in=missing_user_ids
+                ).select_related("user")
+            }
+            cache.set_many(missing_data, timeout=FORUM_USER_CACHE_TIMEOUT)
+            data.update(missing_data)
+        return [
+            data[cache_keys[user_id]]
+            for user_id in user_ids
+            if cache_keys[user_id] in data
+        ]
+
+    def _to_dict(
+        self,
+        course_id: Optional[str] = None,
+        course_stats: Optional[list[CourseStat]] = None,
+        read_states: Optional[list[ReadState]] = None,
+    ) -> dict[str, Any]:
+        """
+        Return a dictionary representation of the model, from the database.
 
+        The course stats and read states of the user are read unless they are given.
+        """
+        if course_stats is None:
+            course_stats = list(CourseStat.objects.filter(user=self.user))
+        if read_states is None:
+            read_states = list(
+                ReadState.objects.filter(user=self.user).prefetch_related(
+                    "last_read_times"
+                )
+            )
+
+        course_stat = None
         if course_id:
-            course_stat = course_stats.filter(course_id=course_id).first()
-        else:
-            course_stat = None
+            course_stat = next(
+                (stat for stat in course_stats if stat.course_id == course_id), None
+            )
 
         return {
             "_id": self.user.pk,
@@ -69,6 +151,7 @@ class CourseStat(models.Model):
     user: models.ForeignKey[User, User] = models.ForeignKey(
         User, related_name="course_stats", on_delete=models.CASCADE
     )
+    user_id: int
 
     def to_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the model."""
@@ -96,6 +179,7 @@ class Content(models.Model):
     author: models.ForeignKey[User, User] = models.ForeignKey(
         User, on_delete=models.CASCADE
     )
+    author_id: int
     course_id: models.CharField[str, str] = models.CharField(max_length=255)
     body: models.TextField[str, str] = models.TextField()
     visible: models.BooleanField[bool, bool] = models.BooleanField(default=True)
@@ -118,6 +202,21 @@ class Content(models.Model):
         object_id_field="content_object_id",
         content_type_field="content_type",
     )
+    abuseflagger = GenericRelation(
+        "AbuseFlagger",
+        object_id_field="content_object_id",
+        content_type_field="content_type",
+    )
+    historicalabuseflagger = GenericRelation(
+        "HistoricalAbuseFlagger",
+        object_id_field="content_object_id",
+        content_type_field="content_type",
+    )
+    edithistory = GenericRelation(
+        "EditHistory",
+        object_id_field="content_object_id",
+        content_type_field="content_type",
+    )
 
     @property
     def type(self) -> str:
@@ -129,22 +228,34 @@ class Content(models.Model):
         """Return the type of content."""
         return ContentType.objects.get_for_model(self)
 
-    @property
+    def _is_prefetched(self, relation: str) -> bool:
+        """Return whether the rows of a relation were prefetched with the content."""
+        return relation in getattr(self, "_prefetched_objects_cache", {})
+
+    @cached_property
     def abuse_flaggers(self) -> list[int]:
         """Return a list of users who have flagged the content for abuse."""
+        if self._is_prefetched("abuseflagger"):
+            return [flagger.user_id for flagger in self.abuseflagger.all()]
         return list(
             AbuseFlagger.objects.filter(
                 content_object_id=self.pk, content_type=self.content_type
-            ).values_list("user_id", flat=True)
+            )
+            .order_by("pk")
+            .values_list("user_id", flat=True)
         )
 
-    @property
+    @cached_property
     def historical_abuse_flaggers(self) -> list[int]:
         """Return a list of users who have historically flagged the content for abuse."""
+        if self._is_prefetched("historicalabuseflagger"):
+            return [flagger.user_id for flagger in self.historicalabuseflagger.all()]
         return list(
             HistoricalAbuseFlagger.objects.filter(
                 content_object_id=self.pk, content_type=self.content_type
-            ).values_list("user_id", flat=True)
+            )
+            .order_by("pk")
+            .values_list("user_id", flat=True)
         )
 
     @property
@@ -154,6 +265,42 @@ class Content(models.Model):
             content_object_id=self.pk, content_type=self.content_type
         )
 
+    def get_edit_history(self) -> list[dict[str, Any]]:
+        """Return the edit history of the content as a list of dicts."""
+        edits: Iterable[tuple[Any, ...]]
+        if self._is_prefetched("edithistory"):
+            edits = [
+                (
+                    edit.pk,
+                    edit.original_body,
+                    edit.reason_code,
+                    edit.editor.username,
+                    edit.editor_id,
+                    edit.created_at,
+                )
+                for edit in self.edithistory.all()
+            ]
+        else:
+            edits = self.edit_history.order_by("pk").values_list(
+                "pk",
+                "original_body",
+                "reason_code",
+                "editor__username",
+                "editor_id",
+                "created_at",
+            )
+        return [
+            {
+                "_id": str(pk),
+                "original_body": original_body,
+                "reason_code": reason_code,
+                "editor_username": editor_username,
+                "author_id": editor_id,
+                "created_at": created_at,
+            }
+            for pk, original_body, reason_code, editor_username, editor_id, created_at in edits
+        ]
+
     @property
     def votes(self) -> models.QuerySet[UserVote]:
         """Get all user vote query for content."""
@@ -162,32 +309,74 @@ class Content(models.Model):
             content_type=self.content_type,
         )
 
-    @property
-    def get_votes(self) -> dict[str, Any]:
+    @cached_property
+    def votes_summary(self) -> dict[str, Any]:
         """Get all user votes for content."""
-        votes: dict[str, Any] = {
-            "up": [],
-            "down": [],
-            "up_count": 0,
-            "down_count": 0,
-            "count": 0,
-            "point": 0,
+        if self._is_prefetched("uservote"):
+            votes = [(vote.user_id, vote.vote) for vote in self.uservote.all()]
+        else:
+            votes = list(self.votes.values_list("user_id", "vote"))
+        up = [user_id for user_id, vote in votes if vote == 1]
+        down = [user_id for user_id, vote in votes if vote == -1]
+        return {
+            "up": up,
+            "down": down,
+            "up_count": len(up),
+            "down_count": len(down),
+            "count": len(up) + len(down),
+            "point": len(up) - len(down),
         }
-        for vote in self.votes:
-            if vote.vote == 1:
-                votes["up"].append(vote.user.pk)
-                votes["up_count"] += 1
-            elif vote.vote == -1:
-                votes["down"].append(vote.user.pk)
-                votes["down_count"] += 1
-            votes["point"] = votes["up_count"] - votes["down_count"]
-            votes["count"] = votes["count"]
-        return votes
+
+    @classmethod
+    def with_serializable(
+        cls, queryset: Optional[QuerySet[Any]] = None
+    ) -> QuerySet[Any]:
+        """
+        Return the contents with the related rows read by to_dict loaded upfront.
+
+        The authors are joined, and the votes, abuse flaggers and edit history of all
+        the contents are fetched in one extra query each, instead of one query of each
+        per content.
+        """
+        if queryset is None:
+            queryset = cls._default_manager.all()
+        return queryset.select_related("author").prefetch_related(
+            "uservote",
+            Prefetch("abuseflagger", queryset=AbuseFlagger.objects.order_by("pk")),
+            Prefetch(
+                "historicalabuseflagger",
+                queryset=HistoricalAbuseFlagger.objects.order_by("pk"),
+            ),
+            Prefetch(
+                "edithistory",
+                queryset=EditHistory.objects.select_related("editor").order_by("pk"),
+            ),
+        )
+
+    def clear_cached_properties(self) -> None:
+        """Drop the cached flaggers and votes so they are read again."""
+        for name in (
+            "abuse_flaggers",
+            "historical_abuse_flaggers",
+            "votes_summary",
+        ):
+            self.__dict__.pop(name, None)
 
     def to_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the content."""
         raise NotImplementedError
 
+    def doc_to_hash(self) -> dict[str, Any]:
+        """Return the search document of the content."""
+        raise NotImplementedError
+
+    @classmethod
+    def iter_index_documents(
+        cls, queryset: QuerySet[Any], chunk_size: int = 500
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield the ID and search document of each content of a queryset."""
+        raise NotImplementedError
+
     class Meta:
         app_label = "forum"
         abstract = True
@@ -216,9 +405,7 @@ class CommentThread(Content):
         max_length=50, choices=CONTEXT_CHOICES, default="course"
     )
     closed: models.BooleanField[bool, bool] = models.BooleanField(default=False)
-    pinned: models.BooleanField[Optional[bool], bool] = models.BooleanField(
-        null=True, blank=True
-    )
+    pinned: models.BooleanField[bool, bool] = models.BooleanField(default=False)
     last_activity_at: models.DateTimeField[Optional[datetime], datetime] = (
         models.DateTimeField(null=True, blank=True)
     )
@@ -232,6 +419,7 @@ class CommentThread(Content):
         blank=True,
         on_delete=models.SET_NULL,
     )
+    closed_by_id: Optional[int]
     commentable_id: models.CharField[str, str] = models.CharField(
         max_length=255,
         default=None,
@@ -239,34 +427,47 @@ class CommentThread(Content):
         null=True,
     )
 
-    @property
-    def comment_count(self) -> int:
-        """Return the number of comments in the thread."""
-        return Comment.objects.filter(comment_thread=self).count()
+    comment_count: models.PositiveIntegerField[int, int] = models.PositiveIntegerField(
+        default=0
+    )
+
+    @classmethod
+    def with_serializable(
+        cls, queryset: Optional[QuerySet[Any]] = None
+    ) -> QuerySet[Any]:
+        """Return the threads with the related rows read by to_dict loaded upfront."""
+        return super().with_serializable(queryset).select_related("closed_by")
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Save the thread without writing its comment count.
+
+        The comment count is only changed by the Comment signal handlers, with
+        database-side increments, so a stale instance must not overwrite it.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred_fields = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name != "comment_count"
+                and field.attname not in deferred_fields
+            ]
+        super().save(*args, **kwargs)
 
     @classmethod
     def get(cls, thread_id: str) -> CommentThread:
         """Get a comment thread model instance."""
-        return cls.objects.get(pk=int(thread_id))
+        return cls.objects.select_related("author", "closed_by").get(pk=int(thread_id))
 
     def to_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the model."""
-        edit_history = []
-        for edit in self.edit_history.all():
-            edit_history.append(
-                {
-                    "_id": str(edit.pk),
-                    "original_body": edit.original_body,
-                    "reason_code": edit.reason_code,
-                    "editor_username": edit.editor.username,
-                    "author_id": edit.editor.pk,
-                    "created_at": edit.created_at,
-                }
-            )
+        edit_history = self.get_edit_history()
 
         return {
             "_id": str(self.pk),
-            "votes": self.get_votes,
+            "votes": self.votes_summary,
             "visible": self.visible,
             "abuse_flaggers": [str(flagger) for flagger in self.abuse_flaggers],
             "historical_abuse_flaggers": [
@@ -278,16 +479,16 @@ class CommentThread(Content):
             "context": self.context,
             "comment_count": self.comment_count,
             "at_position_list": [],
-            "pinned": self.pinned if self.pinned else False,
+            "pinned": self.pinned,
             "title": self.title,
             "body": self.body,
             "course_id": self.course_id,
             "anonymous": self.anonymous,
             "anonymous_to_peers": self.anonymous_to_peers,
             "closed": self.closed,
-            "closed_by_id": str(self.closed_by.pk) if self.closed_by else None,
+            "closed_by_id": str(self.closed_by_id) if self.closed_by_id else None,
             "close_reason_code": self.close_reason_code,
-            "author_id": str(self.author.pk),
+            "author_id": str(self.author_id),
             "author_username": self.author.username,
             "updated_at": self.updated_at,
             "created_at": self.created_at,
@@ -300,31 +501,84 @@ class CommentThread(Content):
         """
         Converts the CommentThread model instance to a dictionary representation for Elasticsearch.
         """
+        return self.values_to_hash(
+            {
+                "pk": self.pk,
+                "title": self.title,
+                "body": self.body,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at,
+                "last_activity_at": self.last_activity_at,
+                "comment_count": self.comment_count,
+                "votes_point": self.votes_summary.get("point"),
+                "context": self.context,
+                "course_id": self.course_id,
+                "commentable_id": self.commentable_id,
+                "author_id": self.author_id,
+                "group_id": self.group_id,
+            }
+        )
+
+    @staticmethod
+    def values_to_hash(values: dict[str, Any]) -> dict[str, Any]:
+        """Build the search document of a thread from its column values."""
         return {
-            "id": str(self.pk),
-            "title": self.title,
-            "body": self.body,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "id": str(values["pk"]),
+            "title": values["title"],
+            "body": values["body"],
+            "created_at": (
+                values["created_at"].isoformat() if values["created_at"] else None
+            ),
+            "updated_at": (
+                values["updated_at"].isoformat() if values["updated_at"] else None
+            ),
             "last_activity_at": (
-                self.last_activity_at.isoformat() if self.last_activity_at else None
+                values["last_activity_at"].isoformat()
+                if values["last_activity_at"]
+                else None
             ),
-            "comment_count": self.comment_count,
-            "votes_point": self.get_votes.get("point"),
-            "context": self.context,
-            "course_id": self.course_id,
-            "commentable_id": self.commentable_id,
-            "author_id": str(self.author.pk),
-            "group_id": self.group_id,
-            "thread_id": str(self.pk),
+            "comment_count": values["comment_count"],
+            "votes_point": values["votes_point"],
+            "context": values["context"],
+            "course_id": values["course_id"],
+            "commentable_id": values["commentable_id"],
+            "author_id": str(values["author_id"]),
+            "group_id": values["group_id"],
+            "thread_id": str(values["pk"]),
         }
 
+    @classmethod
+    def iter_index_documents(
+        cls, queryset: QuerySet[CommentThread], chunk_size: int = 500
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Yield the ID and search document of each thread of a queryset.
+
+        The documents are built from a values() query, with the votes summed in
+        SQL, instead of loading a model instance and its votes for every thread.
+        """
+        rows = queryset.annotate(votes_point=Coalesce(Sum("uservote__vote"), 0)).values(
+            "pk",
+            "title",
+            "body",
+            "created_at",
+            "updated_at",
+            "last_activity_at",
+            "comment_count",
+            "votes_point",
+            "context",
+            "course_id",
+            "commentable_id",
+            "author_id",
+            "group_id",
+        )
+        for values in rows.iterator(chunk_size=chunk_size):
+            yield str(values["pk"]), cls.values_to_hash(values)
+
     class Meta:
         app_label = "forum"
         indexes = [
             models.Index(fields=["context"]),
-            models.Index(fields=["author"]),
-            models.Index(fields=["author", "course_id"]),
             models.Index(fields=["course_id", "anonymous", "anonymous_to_peers"]),
             models.Index(
                 fields=["author", "course_id", "anonymous", "anonymous_to_peers"]
@@ -355,81 +609,107 @@ class Comment(Content):
     parent: models.ForeignKey[Comment, Comment] = models.ForeignKey(
         "self", on_delete=models.CASCADE, null=True, blank=True
     )
+    comment_thread_id: int
+    parent_id: Optional[int]
     depth: models.PositiveIntegerField[int, int] = models.PositiveIntegerField(
         default=0
     )
 
+    @classmethod
+    def from_db(
+        cls, db: Optional[str], field_names: Iterable[str], values: Iterable[Any]
+    ) -> Comment:
+        """
+        Load a comment and remember its thread.
+
+        The comment count handlers compare it on save, to update the counts of both
+        threads when the comment is moved.
+        """
+        instance = super().from_db(db, field_names, values)
+        if "comment_thread_id" in instance.__dict__:
+            instance._saved_comment_thread_id = instance.comment_thread_id
+        return instance
+
     def get_sort_key(self) -> str:
         """Get the sort key for the comment"""
-        if self.parent:
-            return f"{self.parent.pk}-{self.pk}"
+        if self.parent_id is not None:
+            return f"{self.parent_id}-{self.pk}"
         return str(self.pk)
 
     @staticmethod
-    def get_list(**kwargs: Any) -> list[dict[str, Any]]:
+    def get_list(*, sort: Optional[int] = None, **kwargs: Any) -> list[dict[str, Any]]:
         """
         Retrieves a list of all comments in the database based on provided filters.
 
         Args:
+            sort: 1 or -1 to order the comments by ascending or descending sort key.
             kwargs: The filter arguments.
 
         Returns:
             A list of comments.
         """
-        sort = kwargs.pop("sort", None)
-        comments = Comment.objects.filter(**kwargs)
-        if sort:
-            if sort == 1:
-                result = sorted(
-                    comments, key=lambda x: (x.sort_key is None, x.sort_key or "")
-                )
-            elif sort == -1:
-                result = sorted(
-                    comments,
-                    key=lambda x: (x.sort_key is None, x.sort_key or ""),
-                    reverse=True,
-                )
-        return [content.to_dict() for content in result]
+        comments = Comment.with_serializable().filter(**kwargs)
+        if sort == 1:
+            comments = comments.order_by(F("sort_key").asc(nulls_last=True))
+        elif sort == -1:
+            comments = comments.order_by(F("sort_key").desc(nulls_first=True))
+        return [content.to_dict() for content in comments]
 
     def get_parent_ids(self) -> list[str]:
-        """Return a list of all parent IDs of a comment."""
-        parent_ids = []
-        current_comment = self
-        while current_comment.parent:
-            parent_ids.append(str(current_comment.parent.pk))
-            current_comment = current_comment.parent
-        return parent_ids
+        """
+        Return a list of all parent IDs of a comment, from the closest one.
 
-    def to_dict(self) -> dict[str, Any]:
-        """Return a dictionary representation of the model."""
-        edit_history = []
-        for edit in self.edit_history.all():
-            edit_history.append(
-                {
-                    "_id": str(edit.pk),
-                    "original_body": edit.original_body,
-                    "reason_code": edit.reason_code,
-                    "editor_username": edit.editor.username,
-                    "author_id": edit.editor.pk,
-                    "created_at": edit.created_at,
-                }
+        The depth of a comment is its number of ancestors, so replies (depth 1)
+        need no query. Deeper ancestors are read in a single recursive query,
+        bounded by the depth, without loading the comments.
+        """
+        if self.parent_id is None:
+            return []
+        if self.depth <= 1:
+            return [str(self.parent_id)]
+
+        connection = connections[self._state.db or "default"]
+        table = connection.ops.quote_name(self._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH RECURSIVE ancestors (id, parent_id, level) AS (
+                    SELECT id, parent_id, 1 FROM {table} WHERE id = %s
+                    UNION ALL
+                    SELECT comment.id, comment.parent_id, ancestors.level + 1
+                    FROM {table} comment
+                    JOIN ancestors ON comment.id = ancestors.parent_id
+                    WHERE ancestors.level < %s
+                )
+                SELECT id FROM ancestors ORDER BY level
+                """,
+                [self.parent_id, self.depth],
             )
+            return [str(parent_id) for (parent_id,) in cursor.fetchall()]
 
-        endorsement = {
-            "user_id": self.endorsement.get("user_id") if self.endorsement else None,
-            "time": self.endorsement.get("time") if self.endorsement else None,
-        }
+    def to_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the model."""
+        edit_history = self.get_edit_history()
+
+        endorsement = (
+            {
+                "user_id": self.endorsement.get("user_id"),
+                "time": self.endorsement.get("time"),
+            }
+            if self.endorsement
+            else None
+        )
 
         data = {
             "_id": str(self.pk),
-            "votes": self.get_votes,
+            "votes": self.votes_summary,
             "visible": self.visible,
             "abuse_flaggers": [str(flagger) for flagger in self.abuse_flaggers],
             "historical_abuse_flaggers": [
                 str(flagger) for flagger in self.historical_abuse_flaggers
             ],
             "parent_ids": self.get_parent_ids(),
-            "parent_id": str(self.parent.pk) if self.parent else "None",
+            "parent_id": str(self.parent_id) if self.parent_id is not None else "None",
             "at_position_list": [],
             "body": self.body,
             "course_id": self.course_id,
@@ -437,14 +717,14 @@ class Comment(Content):
             "endorsed": self.endorsed,
             "anonymous": self.anonymous,
             "anonymous_to_peers": self.anonymous_to_peers,
-            "author_id": str(self.author.pk),
-            "comment_thread_id": str(self.comment_thread.pk),
+            "author_id": str(self.author_id),
+            "comment_thread_id": str(self.comment_thread_id),
             "child_count": self.child_count,
             "author_username": self.author.username,
             "sk": str(self.pk),
             "updated_at": self.updated_at,
             "created_at": self.created_at,
-            "endorsement": endorsement if self.endorsement else None,
+            "endorsement": endorsement,
         }
         if edit_history:
             data["edit_history"] = edit_history
@@ -456,26 +736,67 @@ class Comment(Content):
         """Get a comment model instance."""
         return cls.objects.get(pk=int(comment_id))
 
+    @classmethod
+    def get_many(cls, comment_ids: list[str]) -> dict[int, Comment]:
+        """Get the comment model instances of several ids, keyed by id, in one query."""
+        return cls.with_serializable().in_bulk(
+            [int(comment_id) for comment_id in comment_ids]
+        )
+
     def doc_to_hash(self) -> dict[str, Any]:
         """
         Converts the Comment model instance to a dictionary representation for Elasticsearch.
         """
+        return self.values_to_hash(
+            {
+                "body": self.body,
+                "course_id": self.course_id,
+                "comment_thread_id": self.comment_thread_id,
+                "group_id": self.group_id,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at,
+            }
+        )
+
+    @staticmethod
+    def values_to_hash(values: dict[str, Any]) -> dict[str, Any]:
+        """Build the search document of a comment from its column values."""
         return {
-            "body": self.body,
-            "course_id": self.course_id,
-            "comment_thread_id": self.comment_thread.pk,
+            "body": values["body"],
+            "course_id": values["course_id"],
+            "comment_thread_id": values["comment_thread_id"],
             "commentable_id": None,
-            "group_id": self.group_id,
+            "group_id": values["group_id"],
             "context": "course",
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": values["created_at"].isoformat(),
+            "updated_at": values["updated_at"].isoformat(),
             "title": None,
         }
 
+    @classmethod
+    def iter_index_documents(
+        cls, queryset: QuerySet[Comment], chunk_size: int = 500
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Yield the ID and search document of each comment of a queryset.
+
+        The documents are built from a values() query instead of model instances.
+        """
+        rows = queryset.values(
+            "pk",
+            "body",
+            "course_id",
+            "comment_thread_id",
+            "group_id",
+            "created_at",
+            "updated_at",
+        )
+        for values in rows.iterator(chunk_size=chunk_size):
+            yield str(values["pk"]), cls.values_to_hash(values)
+
     class Meta:
         app_label = "forum"
         indexes = [
-            models.Index(fields=["author", "course_id"]),
             models.Index(fields=["comment_thread", "author", "created_at"]),
             models.Index(fields=["comment_thread", "endorsed"]),
             models.Index(fields=["course_id", "parent", "endorsed"]),
@@ -510,6 +831,7 @@ class EditHistory(models.Model):
     editor: models.ForeignKey[User, User] = models.ForeignKey(
         User, on_delete=models.CASCADE
     )
+    editor_id: int
     created_at: models.DateTimeField[datetime, datetime] = models.DateTimeField(
         auto_now_add=True
     )
@@ -543,6 +865,7 @@ class AbuseFlagger(models.Model):
     user: models.ForeignKey[User, User] = models.ForeignKey(
         User, on_delete=models.CASCADE
     )
+    user_id: int
     flagged_at: models.DateTimeField[datetime, datetime] = models.DateTimeField(
         default=timezone.now
     )
@@ -551,8 +874,7 @@ class AbuseFlagger(models.Model):
         app_label = "forum"
         unique_together = ("user", "content_type", "content_object_id")
         indexes = [
-            models.Index(fields=["content_type", "content_object_id"]),
-            models.Index(fields=["user", "content_type", "content_object_id"]),
+            models.Index(fields=["content_type", "content_object_id", "user"]),
         ]
 
 
@@ -569,6 +891,7 @@ class HistoricalAbuseFlagger(models.Model):
     user: models.ForeignKey[User, User] = models.ForeignKey(
         User, on_delete=models.CASCADE
     )
+    user_id: int
     flagged_at: models.DateTimeField[datetime, datetime] = models.DateTimeField(
         default=timezone.now
     )
@@ -577,8 +900,7 @@ class HistoricalAbuseFlagger(models.Model):
         app_label = "forum"
         unique_together = ("user", "content_type", "content_object_id")
         indexes = [
-            models.Index(fields=["content_type", "content_object_id"]),
-            models.Index(fields=["user", "content_type", "content_object_id"]),
+            models.Index(fields=["content_type", "content_object_id", "user"]),
         ]
 
 
@@ -589,13 +911,14 @@ class ReadState(models.Model):
     user: models.ForeignKey[User, User] = models.ForeignKey(
         User, related_name="read_states", on_delete=models.CASCADE
     )
+    user_id: int
     last_read_times: models.QuerySet[LastReadTime]
 
     def to_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the model."""
         last_read_times = {}
         for last_read_time in self.last_read_times.all():
-            last_read_times[str(last_read_time.comment_thread.pk)] = (
+            last_read_times[str(last_read_time.comment_thread_id)] = (
                 last_read_time.timestamp
             )
         return {
@@ -621,13 +944,14 @@ class LastReadTime(models.Model):
     comment_thread: models.ForeignKey[CommentThread, CommentThread] = models.ForeignKey(
         CommentThread, on_delete=models.CASCADE
     )
+    comment_thread_id: int
     timestamp: models.DateTimeField[datetime, datetime] = models.DateTimeField()
 
     class Meta:
         app_label = "forum"
         unique_together = ("read_state", "comment_thread")
         indexes = [
-            models.Index(fields=["read_state", "timestamp"]),
+            models.Index(fields=["read_state", "comment_thread", "timestamp"]),
             models.Index(fields=["comment_thread"]),
         ]
 
@@ -645,6 +969,7 @@ class UserVote(models.Model):
         models.PositiveIntegerField()
     )
     content: GenericForeignKey = GenericForeignKey("content_type", "content_object_id")
+    user_id: int
     vote: models.IntegerField[int, int] = models.IntegerField(
         validators=[validate_upvote_or_downvote]
     )
@@ -665,15 +990,20 @@ class Subscription(models.Model):
     subscriber: models.ForeignKey[User, User] = models.ForeignKey(
         User, on_delete=models.CASCADE
     )
+    subscriber_id: int
     source_content_type: models.ForeignKey[ContentType, ContentType] = (
         models.ForeignKey(ContentType, on_delete=models.CASCADE)
     )
+    source_content_type_id: int
     source_object_id: models.PositiveIntegerField[int, int] = (
         models.PositiveIntegerField()
     )
     source: GenericForeignKey = GenericForeignKey(
         "source_content_type", "source_object_id"
     )
+    course_id: models.CharField[Optional[str], str] = models.CharField(
+        max_length=255, null=True, blank=True
+    )
     created_at: models.DateTimeField[datetime, datetime] = models.DateTimeField(
         auto_now_add=True
     )
@@ -681,13 +1011,42 @@ class Subscription(models.Model):
         auto_now=True
     )
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Save the subscription, copying the course of its source on creation.
+
+        The course is stored on the subscription so that the subscriptions of a
+        user in a course are found without joining the threads. Callers pass it
+        from the source they already hold; it is only looked up when missing.
+        """
+        if self._state.adding and self.course_id is None:
+            self.course_id = self._get_source_course_id()
+        super().save(*args, **kwargs)
+
+    def _get_source_course_id(self) -> Optional[str]:
+        """Return the course of the source, without loading it if it is not cached."""
+        if Subscription.source.is_cached(self):
+            return getattr(self.source, "course_id", None)
+        model = ContentType.objects.get_for_id(
+            self.source_content_type_id
+        ).model_class()
+        if model is None:
+            return None
+        return (
+            model._default_manager.filter(pk=self.source_object_id)
+            .values_list("course_id", flat=True)
+            .first()
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the model."""
         return {
             "_id": str(self.pk),
-            "subscriber_id": str(self.subscriber.pk),
+            "subscriber_id": str(self.subscriber_id),
             "source_id": str(self.source_object_id),
-            "source_type": self.source_content_type.model,
+            "source_type": ContentType.objects.get_for_id(
+                self.source_content_type_id
+            ).model,
             "updated_at": self.updated_at,
             "created_at": self.created_at,
         }
@@ -700,7 +1059,7 @@ class Subscription(models.Model):
             models.Index(
                 fields=["subscriber", "source_object_id", "source_content_type"]
             ),
-            models.Index(fields=["subscriber", "source_content_type"]),
+            models.Index(fields=["subscriber", "source_content_type", "course_id"]),
             models.Index(fields=["source_object_id", "source_content_type"]),
         ]
 
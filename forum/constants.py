@@ -9,3 +9,16 @@ FORUM_MAX_DEEP_SEARCH_COMMENT_COUNT = 1000
 
 RETIRED_TITLE = "[deleted]"
 RETIRED_BODY = "[deleted]"
+
+# Seconds during which the commentables counts of a course are served from the cache.
+COMMENTABLES_COUNTS_CACHE_TIMEOUT = 60
+# Thread fields that the commentables counts depend on.
+COMMENTABLES_COUNTS_FIELDS = frozenset({"course_id", "commentable_id", "thread_type"})
+# Counters of the course stats of a user.
+COURSE_STATS_COUNTERS = frozenset(
+    {"active_flags", "inactive_flags", "threads", "responses", "replies"}
+)
+# Seconds during which the serialized MySQL forum users are served from the cache.
+FORUM_USER_CACHE_TIMEOUT = 60
+# Seconds during which identical thread searches are served from the cache.
+SEARCH_THREADS_CACHE_TIMEOUT = 30
@@ -3,39 +3,62 @@ Handlers for the forum app.
 """
 
 import logging
-from typing import Any
-from django.db.models.signals import post_save, post_delete
+from typing import Any, Optional
+from django.contrib.auth.models import User  # pylint: disable=E5142
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from forum.search import get_document_search_backend
-from forum.utils import get_str_value_from_collection
-from forum.models import Comment, CommentThread
+from forum.utils import (
+    get_str_value_from_collection,
+    invalidate_commentables_counts,
+    invalidate_forum_user_cache,
+    invalidate_search_threads_cache,
+)
+from forum.models import (
+    AbuseFlagger,
+    Comment,
+    CommentThread,
+    CourseStat,
+    ForumUser,
+    HistoricalAbuseFlagger,
+    LastReadTime,
+    ReadState,
+    UserVote,
+)
 
 log = logging.getLogger(__name__)
 
 
-def handle_comment_thread_deletion(sender: Any, **kwargs: dict[str, str]) -> None:
+def handle_comment_thread_deletion(sender: Any, **kwargs: Any) -> None:
     """
     Handle the deletion of a comment thread from the Elasticsearch index.
 
     Args:
         sender (Any): The model class that sends the signal.
-        **kwargs (dict[str, Any]): Additional arguments, including 'comment_thread_id'.
+        **kwargs (dict[str, Any]): Additional arguments, including 'comment_thread_id'
+            and 'course_id'.
     """
     thread_id = get_str_value_from_collection(kwargs, "comment_thread_id")
+    invalidate_commentables_counts(kwargs.get("course_id"))
+    invalidate_search_threads_cache(course_id=kwargs.get("course_id"))
     search_backend = get_document_search_backend()
     search_backend.delete_document(sender.index_name, thread_id)
 
 
-def handle_comment_deletion(sender: Any, **kwargs: dict[str, Any]) -> None:
+def handle_comment_deletion(sender: Any, **kwargs: Any) -> None:
     """
     Handle the deletion of a comment from the Elasticsearch index.
 
     Args:
         sender (Any): The model class that sends the signal.
-        **kwargs (dict[str, Any]): Additional arguments, including 'comment_id'.
+        **kwargs (dict[str, Any]): Additional arguments, including 'comment_id'
+            and 'course_id'.
     """
     comment_id = get_str_value_from_collection(kwargs, "comment_id")
+    invalidate_search_threads_cache(course_id=kwargs.get("course_id"))
     search_backend = get_document_search_backend()
     search_backend.delete_document(sender.index_name, comment_id)
 
@@ -50,9 +73,12 @@ def handle_comment_thread_insertion(sender: Any, **kwargs: dict[str, Any]) -> No
     """
     thread_id = get_str_value_from_collection(kwargs, "comment_thread_id")
     thread = sender().get(_id=thread_id)
+    if thread:
+        invalidate_commentables_counts(thread.get("course_id"))
+        invalidate_search_threads_cache(course_id=thread.get("course_id"))
     doc = sender().doc_to_hash(thread)
     get_document_search_backend().index_document(sender.index_name, thread_id, doc)
-    log.info(f"Thread {thread_id} added to Elasticsearch index")
+    log.info("Thread %s added to Elasticsearch index", thread_id)
 
 
 def handle_comment_insertion(sender: Any, **kwargs: dict[str, Any]) -> None:
@@ -65,9 +91,11 @@ def handle_comment_insertion(sender: Any, **kwargs: dict[str, Any]) -> None:
     """
     comment_id = get_str_value_from_collection(kwargs, "comment_id")
     comment = sender().get(_id=comment_id)
+    if comment:
+        invalidate_search_threads_cache(course_id=comment.get("course_id"))
     doc = sender().doc_to_hash(comment)
     get_document_search_backend().index_document(sender.index_name, comment_id, doc)
-    log.info(f"Comment {comment_id} added to Elasticsearch index")
+    log.info("Comment %s added to Elasticsearch index", comment_id)
 
 
 def handle_comment_thread_updated(sender: Any, **kwargs: dict[str, Any]) -> None:
@@ -76,13 +104,18 @@ def handle_comment_thread_updated(sender: Any, **kwargs: dict[str, Any]) -> None
 
     Args:
         sender (Any): The model class that sends the signal.
-        **kwargs (dict[str, Any]): Additional arguments, including 'comment_thread_id'.
+        **kwargs (dict[str, Any]): Additional arguments, including 'comment_thread_id'
+            and 'commentables_counts_changed'.
     """
     thread_id = get_str_value_from_collection(kwargs, "comment_thread_id")
     thread = sender().get(_id=thread_id)
+    if thread:
+        if kwargs.get("commentables_counts_changed"):
+            invalidate_commentables_counts(thread.get("course_id"))
+        invalidate_search_threads_cache(course_id=thread.get("course_id"))
     doc = sender().doc_to_hash(thread)
     get_document_search_backend().update_document(sender.index_name, thread_id, doc)
-    log.info(f"Thread {thread_id} added to Elasticsearch index")
+    log.info("Thread %s added to Elasticsearch index", thread_id)
 
 
 def handle_comment_updated(sender: Any, **kwargs: dict[str, Any]) -> None:
@@ -95,9 +128,11 @@ def handle_comment_updated(sender: Any, **kwargs: dict[str, Any]) -> None:
     """
     comment_id = get_str_value_from_collection(kwargs, "comment_id")
     comment = sender().get(_id=comment_id)
+    if comment:
+        invalidate_search_threads_cache(course_id=comment.get("course_id"))
     doc = sender().doc_to_hash(comment)
     get_document_search_backend().update_document(sender.index_name, comment_id, doc)
-    log.info(f"Comment {comment_id} added to Elasticsearch index")
+    log.info("Comment %s added to Elasticsearch index", comment_id)
 
 
 @receiver(post_delete, sender=CommentThread)
@@ -111,9 +146,10 @@ def handle_deletion(sender: Any, instance: Any, **kwargs: dict[str, Any]) -> Non
         instance (Any): The instance of the deleted comment thread or comment.
     """
     document_id = instance.id
+    invalidate_search_threads_cache(course_id=instance.course_id)
     search_backend = get_document_search_backend()
     search_backend.delete_document(sender.index_name, document_id)
-    log.info(f"{sender.__name__} {document_id} deleted from the search backend")
+    log.info("%s %s deleted from the search backend", sender.__name__, document_id)
 
 
 @receiver(post_save, sender=CommentThread)
@@ -130,12 +166,158 @@ def handle_comment_thread_and_comment(
         created (bool): Indicates if the instance was created.
     """
     document_id = instance.id
+    invalidate_search_threads_cache(course_id=instance.course_id)
     search_backend = get_document_search_backend()
+    instance.clear_cached_properties()
     doc = instance.doc_to_hash()
 
     if created:
         search_backend.index_document(sender.index_name, document_id, doc)
-        log.info(f"{sender.__name__} {document_id} added to the search backend")
+        log.info("%s %s added to the search backend", sender.__name__, document_id)
     else:
         search_backend.update_document(sender.index_name, document_id, doc)
-        log.info(f"{sender.__name__} {document_id} updated in the search backend")
+        log.info("%s %s updated in the search backend", sender.__name__, document_id)
+
+
+@receiver(post_save, sender=CommentThread)
+def handle_comment_thread_commentables_counts(
+    sender: Any, instance: Any, created: bool, **kwargs: dict[str, Any]
+) -> None:
+    """
+    Invalidate the cached commentables counts when a MySQL thread is created.
+
+    Threads moved to another course, commentable or type are handled by
+    MySQLBackend.update_thread, which knows the values they had before.
+
+    Args:
+        sender (Any): The model class that sends the signal.
+        instance (Any): The instance of the saved comment thread.
+        created (bool): Indicates if the instance was created.
+    """
+    if created:
+        invalidate_commentables_counts(instance.course_id)
+
+
+@receiver(post_delete, sender=CommentThread)
+def handle_comment_thread_commentables_counts_deletion(
+    sender: Any, instance: Any, **kwargs: dict[str, Any]
+) -> None:
+    """
+    Invalidate the cached commentables counts when a MySQL comment thread is deleted.
+
+    Args:
+        sender (Any): The model class that sends the signal.
+        instance (Any): The instance of the deleted comment thread.
+    """
+    invalidate_commentables_counts(instance.course_id)
+
+
+def update_comment_count(comment_thread_id: Optional[int], count: int) -> None:
+    """
+    Add count to the comment count of a MySQL thread, in the database.
+
+    Args:
+        comment_thread_id (Optional[int]): The ID of the thread to update.
+        count (int): The number of comments added (or removed, if negative).
+    """
+    if comment_thread_id is not None:
+        CommentThread.objects.filter(pk=comment_thread_id).update(
+            comment_count=F("comment_count") + count
+        )
+
+
+@receiver(post_save, sender=Comment)
+def handle_comment_comment_count(
+    sender: Any, instance: Any, created: bool, **kwargs: dict[str, Any]
+) -> None:
+    """
+    Update the comment count of the thread of a MySQL comment that is created or moved.
+
+    Args:
+        sender (Any): The model class that sends the signal.
+        instance (Any): The instance of the saved comment.
+        created (bool): Indicates if the instance was created.
+    """
+    current = instance.__dict__.get("comment_thread_id")
+    # Comment.from_db remembers the thread of the comments loaded from the database.
+    previous = (
+        None if created else getattr(instance, "_saved_comment_thread_id", current)
+    )
+    if previous != current:
+        update_comment_count(previous, -1)
+        update_comment_count(current, 1)
+    instance._saved_comment_thread_id = current
+
+
+@receiver(post_delete, sender=Comment)
+def handle_comment_comment_count_deletion(
+    sender: Any, instance: Any, **kwargs: dict[str, Any]
+) -> None:
+    """
+    Update the comment count of the thread of a MySQL comment that is deleted.
+
+    Args:
+        sender (Any): The model class that sends the signal.
+        instance (Any): The instance of the deleted comment.
+    """
+    update_comment_count(instance.__dict__.get("comment_thread_id"), -1)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=ForumUser)
+@receiver(post_delete, sender=ForumUser)
+@receiver(post_save, sender=CourseStat)
+@receiver(post_delete, sender=CourseStat)
+@receiver(post_save, sender=ReadState)
+@receiver(post_delete, sender=ReadState)
+def handle_forum_user_cache(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """
+    Invalidate the cached forum user when the user, its course stats or its read states change.
+
+    Args:
+        sender (Any): The model class that sends the signal.
+        instance (Any): The instance of the saved or deleted model.
+    """
+    user_id = instance.pk if sender is User else instance.user_id
+    invalidate_forum_user_cache(str(user_id))
+
+
+@receiver(post_save, sender=LastReadTime)
+@receiver(post_delete, sender=LastReadTime)
+def handle_last_read_time_forum_user_cache(
+    sender: Any, instance: Any, **kwargs: Any
+) -> None:
+    """
+    Invalidate the cached forum user when one of its last read times changes.
+
+    Args:
+        sender (Any): The model class that sends the signal.
+        instance (Any): The instance of the saved or deleted last read time.
+    """
+    invalidate_forum_user_cache(str(instance.read_state.user_id))
+
+
+@receiver(post_save, sender=UserVote)
+@receiver(post_delete, sender=UserVote)
+@receiver(post_save, sender=AbuseFlagger)
+@receiver(post_delete, sender=AbuseFlagger)
+@receiver(post_save, sender=HistoricalAbuseFlagger)
+@receiver(post_delete, sender=HistoricalAbuseFlagger)
+def handle_thread_related_search_cache(
+    sender: Any, instance: Any, **kwargs: Any
+) -> None:
+    """
+    Invalidate the cached searches of a course when a vote or flag of one of its threads changes.
+
+    Args:
+        sender (Any): The model class that sends the signal.
+        instance (Any): The instance of the saved or deleted vote or flag.
+    """
+    if instance.content_type_id == ContentType.objects.get_for_model(CommentThread).pk:
+        course_id = (
+            CommentThread.objects.filter(pk=instance.content_object_id)
+            .values_list("course_id", flat=True)
+            .first()
+        )
+        invalidate_search_threads_cache(course_id=course_id)
@@ -92,7 +92,7 @@ def create_or_update_thread(thread_data: dict[str, Any]) -> None:
             anonymous=thread_data.get("anonymous", False),
             anonymous_to_peers=thread_data.get("anonymous_to_peers", False),
             closed=thread_data.get("closed", False),
-            pinned=thread_data.get("pinned"),
+            pinned=bool(thread_data.get("pinned")),
             created_at=make_aware(thread_data["created_at"]),
             updated_at=make_aware(thread_data["updated_at"]),
             last_activity_at=make_aware(thread_data["last_activity_at"]),
@@ -230,6 +230,7 @@ def migrate_subscriptions(db: Database[dict[str, Any]], content_id: str) -> None
                 source_content_type=content.content_type,
                 source_object_id=content.pk,
                 defaults={
+                    "course_id": content.course_id,
                     "created_at": sub.get("created_at", timezone.now()),
                     "updated_at": sub.get("updated_at", timezone.now()),
                 },
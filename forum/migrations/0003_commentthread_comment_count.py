@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-16 16:30
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_comment_count(apps, schema_editor):
+    """Set the comment count of the existing threads."""
+    Comment = apps.get_model("forum", "Comment")
+    CommentThread = apps.get_model("forum", "CommentThread")
+    comment_counts = (
+        Comment.objects.filter(comment_thread=OuterRef("pk"))
+        .order_by()
+        .values("comment_thread")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    CommentThread.objects.update(
+        comment_count=Coalesce(
+            Subquery(comment_counts, output_field=models.PositiveIntegerField()), 0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forum", "0002_alter_readstate_course_id_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="commentthread",
+            name="comment_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_comment_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-16 16:32
+
+from django.db import migrations, models
+
+
+def unpin_null_threads(apps, schema_editor):
+    """Store the threads without a pinned value as not pinned."""
+    CommentThread = apps.get_model("forum", "CommentThread")
+    CommentThread.objects.filter(pinned__isnull=True).update(pinned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forum", "0003_commentthread_comment_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(unpin_null_threads, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="commentthread",
+            name="pinned",
+            field=models.BooleanField(default=False),
+        ),
+    ]
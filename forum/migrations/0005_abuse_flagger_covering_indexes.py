@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-16 16:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forum", "0004_commentthread_pinned_not_null"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="abuseflagger",
+            index=models.Index(
+                fields=["content_type", "content_object_id", "user"],
+                name="forum_abuse_content_bfdc44_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="historicalabuseflagger",
+            index=models.Index(
+                fields=["content_type", "content_object_id", "user"],
+                name="forum_histo_content_50749a_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="abuseflagger",
+            name="forum_abuse_content_b190f5_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="abuseflagger",
+            name="forum_abuse_user_id_8f5d27_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="historicalabuseflagger",
+            name="forum_histo_content_e4456d_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="historicalabuseflagger",
+            name="forum_histo_user_id_761c88_idx",
+        ),
+    ]
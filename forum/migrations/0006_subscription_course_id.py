@@ -0,0 +1,52 @@
+# Generated by Django 4.2.30 on 2026-10-16 16:42
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_subscription_course_id(apps, schema_editor):
+    """Copy the course of the subscribed threads and comments to the subscriptions."""
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Subscription = apps.get_model("forum", "Subscription")
+    for model_name in ["commentthread", "comment"]:
+        content_type = ContentType.objects.filter(
+            app_label="forum", model=model_name
+        ).first()
+        if content_type is None:
+            continue
+        Content = apps.get_model("forum", model_name)
+        Subscription.objects.filter(source_content_type=content_type).update(
+            course_id=Subquery(
+                Content.objects.filter(pk=OuterRef("source_object_id")).values(
+                    "course_id"
+                )[:1]
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("forum", "0005_abuse_flagger_covering_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="subscription",
+            name="course_id",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.RunPython(fill_subscription_course_id, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="subscription",
+            index=models.Index(
+                fields=["subscriber", "source_content_type", "course_id"],
+                name="forum_subsc_subscri_ed0310_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="subscription",
+            name="forum_subsc_subscri_a64d92_idx",
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-16 16:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forum", "0006_subscription_course_id"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="comment",
+            name="forum_comme_author__257002_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="commentthread",
+            name="forum_comme_author__04774e_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="commentthread",
+            name="forum_comme_author__e6f558_idx",
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-16 16:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forum", "0007_drop_redundant_author_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="lastreadtime",
+            index=models.Index(
+                fields=["read_state", "comment_thread", "timestamp"],
+                name="forum_lastr_read_st_f91e84_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="lastreadtime",
+            name="forum_lastr_read_st_67a4f9_idx",
+        ),
+    ]
@@ -92,11 +92,15 @@ class ElasticsearchDocumentBackend(
         """
         try:
             self.client.update(index=index_name, id=doc_id, body={"doc": update_data})
-            log.info(f"Document {doc_id} in index {index_name} updated successfully.")
+            log.info(
+                "Document %s in index %s updated successfully.", doc_id, index_name
+            )
         except exceptions.NotFoundError:
-            log.error(f"Document {doc_id} not found in index {index_name}.")
+            log.error("Document %s not found in index %s.", doc_id, index_name)
         except exceptions.RequestError as e:
-            log.error(f"Error updating document {doc_id} in index {index_name}: {e}")
+            log.error(
+                "Error updating document %s in index %s: %s", doc_id, index_name, e
+            )
 
     def delete_document(self, index_name: str, doc_id: str | int) -> None:
         """
@@ -108,11 +112,15 @@ class ElasticsearchDocumentBackend(
         """
         try:
             self.client.delete(index=index_name, id=doc_id)
-            log.info(f"Document {doc_id} in index {index_name} deleted successfully.")
+            log.info(
+                "Document %s in index %s deleted successfully.", doc_id, index_name
+            )
         except exceptions.NotFoundError:
-            log.error(f"Document {doc_id} not found in index {index_name}.")
+            log.error("Document %s not found in index %s.", doc_id, index_name)
         except exceptions.RequestError as e:
-            log.error(f"Error deleting document {doc_id} from index {index_name}: {e}")
+            log.error(
+                "Error deleting document %s from index %s: %s", doc_id, index_name, e
+            )
 
     def index_document(
         self, index_name: str, doc_id: str | int, document: dict[str, Any]
@@ -127,9 +135,9 @@ class ElasticsearchDocumentBackend(
         """
         try:
             self.client.index(index=index_name, id=doc_id, body=document)
-            log.info(f"Document {doc_id} indexed in {index_name}")
+            log.info("Document %s indexed in %s", doc_id, index_name)
         except exceptions.RequestError as e:
-            log.error(f"Error indexing document {doc_id} in {index_name}: {e}")
+            log.error("Error indexing document %s in %s: %s", doc_id, index_name, e)
 
 
 class ElasticsearchIndexBackend(
@@ -279,7 +287,7 @@ class ElasticsearchIndexBackend(
             ):
                 self.batch_import_post_process(response, current_batch)
                 current_batch += 1
-        log.info(f"Catch up from {start_time} complete.")
+        log.info("Catch up from %s complete.", start_time)
 
     def create_indices(self) -> list[str]:
         """
@@ -298,7 +306,7 @@ class ElasticsearchIndexBackend(
                 index=index_name,
                 body={"mappings": self.MAPPINGS[model.index_name]},
             )
-        log.info(f"New indices {index_names} are created.")
+        log.info("New indices %s are created.", index_names)
         return index_names
 
     def delete_index(self, name: str) -> None:
@@ -309,7 +317,7 @@ class ElasticsearchIndexBackend(
             name (str): The name of the index to delete.
         """
         self.client.indices.delete(index=name)
-        log.info(f"Deleted index: {name}.")
+        log.info("Deleted index: %s.", name)
 
     def delete_unused_indices(self) -> int:
         """
@@ -347,7 +355,7 @@ class ElasticsearchIndexBackend(
         }
         if indices_to_delete:
             self.client.indices.delete(index=",".join(indices_to_delete))
-            log.info(f"Deleted unused indices: {indices_to_delete}")
+            log.info("Deleted unused indices: %s", indices_to_delete)
 
         return len(indices_to_delete)
 
@@ -364,9 +372,11 @@ class ElasticsearchIndexBackend(
         success_count, errors = response
         for item in errors:
             if "error" in item["index"]:
-                log.error(f"Error indexing. Response was: {response}")
+                log.error("Error indexing. Response was: %s", response)
         log.info(
-            f"Imported {success_count} documents to the batch {batch_number} into the index"
+            "Imported %s documents to the batch %s into the index",
+            success_count,
+            batch_number,
         )
 
     def move_alias(
@@ -415,10 +425,10 @@ class ElasticsearchIndexBackend(
                     },
                 )
         except exceptions.NotFoundError as e:
-            log.warning(f"Alias not found for {alias_name}: {e}")
+            log.warning("Alias not found for %s: %s", alias_name, e)
 
         self.client.indices.update_aliases(body={"actions": actions})
-        log.info(f"Alias [{alias_name}] now points to index [{index_name}].")
+        log.info("Alias [%s] now points to index [%s].", alias_name, index_name)
 
     def refresh_indices(self) -> None:
         """
@@ -564,11 +574,11 @@ class ElasticsearchIndexBackend(
             queryset = queryset.filter(**query)
 
         actions = []
-        for doc in queryset.iterator(chunk_size=batch_size):
+        for doc_id, doc in model.iter_index_documents(queryset, chunk_size=batch_size):
             action = {
                 "_index": index_name,
-                "_id": str(doc.id),
-                "_source": model.doc_to_hash(doc),
+                "_id": doc_id,
+                "_source": doc,
             }
             actions.append(action)
             if len(actions) >= batch_size:
@@ -738,6 +748,9 @@ class ElasticsearchThreadSearchBackend(
         )
         search_body = {
             "size": FORUM_MAX_DEEP_SEARCH_COMMENT_COUNT,
+            # Only the ids are read from the hits: don't ship the documents back.
+            "_source": ["comment_thread_id"],
+            "track_total_hits": False,
             "sort": sort_criteria or [{"updated_at": "desc"}],
             "query": {
                 "bool": {"must": must_clause or [], "should": filter_clause or []}
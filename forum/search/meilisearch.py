@@ -7,7 +7,6 @@ import typing as t
 import meilisearch
 import search.meilisearch as m
 from bs4 import BeautifulSoup
-from django.core.paginator import Paginator
 
 from forum import constants
 from forum.backends.mysql import MODEL_INDICES
@@ -122,15 +121,16 @@ class MeilisearchIndexBackend(base.BaseIndexSearchBackend, MeilisearchClientMixi
         self.initialize_indices()
         for Model in MODEL_INDICES:
             meilisearch_index = self.get_index(Model.index_name)
-            paginator = Paginator(Model.objects.all(), per_page=batch_size)
-            for page_number in paginator.page_range:
-                page = paginator.get_page(page_number)
-                documents = [
-                    create_document(obj.doc_to_hash(), str(obj.id))
-                    for obj in page.object_list
-                ]
-                if documents:
+            documents = []
+            for doc_id, doc in Model.iter_index_documents(
+                Model.objects.all(), chunk_size=batch_size
+            ):
+                documents.append(create_document(doc, doc_id))
+                if len(documents) >= batch_size:
                     meilisearch_index.add_documents(documents)
+                    documents = []
+            if documents:
+                meilisearch_index.add_documents(documents)
 
     def delete_unused_indices(self) -> int:
         """
@@ -198,6 +198,7 @@ class MeilisearchThreadSearchBackend(
             field_dictionary=constraints,
         )
         search_params["attributesToSearchOn"] = ["title", "body"]
+        search_params["attributesToRetrieve"] = ["id", "comment_thread_id"]
 
         # Collect thread IDs
         # Note that it's absolutely useless to try to sort threads by score, because
@@ -2,7 +2,8 @@
 Serializer for the comment data.
 """
 
-from typing import Any
+import copy
+from typing import Any, Optional
 
 from rest_framework import serializers
 
@@ -57,13 +58,56 @@ class CommentSerializer(ContentSerializer):
     endorsement = EndorsementSerializer(default=None, required=False, allow_null=True)
     children = serializers.SerializerMethodField()
 
+    _fields_template: Optional[dict[str, serializers.Field[Any, Any, Any, Any]]] = None
+    _fields_by_exclusion: Optional[
+        dict[
+            frozenset[str],
+            tuple[tuple[str, serializers.Field[Any, Any, Any, Any]], ...],
+        ]
+    ] = None
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        exclude_fields = kwargs.pop("exclude_fields", None)
+        self.exclude_fields = frozenset(kwargs.pop("exclude_fields", None) or ())
         self.backend = kwargs.pop("backend")
         super().__init__(*args, **kwargs)
-        if exclude_fields:
-            for field in exclude_fields:
-                self.fields.pop(field, None)
+
+    def get_active_fields(
+        self,
+    ) -> tuple[tuple[str, serializers.Field[Any, Any, Any, Any]], ...]:
+        """
+        Return the declared fields that are not excluded, computed once per exclusion.
+        """
+        cls = type(self)
+        fields_by_exclusion = cls.__dict__.get("_fields_by_exclusion")
+        if fields_by_exclusion is None:
+            fields_by_exclusion = cls._fields_by_exclusion = {}
+        active_fields = fields_by_exclusion.get(self.exclude_fields)
+        if active_fields is None:
+            template = cls.__dict__.get("_fields_template")
+            if template is None:
+                template = cls._fields_template = super().get_fields()
+            active_fields = fields_by_exclusion[self.exclude_fields] = tuple(
+                (name, field)
+                for name, field in template.items()
+                if name not in self.exclude_fields
+            )
+        return active_fields
+
+    def get_fields(self) -> dict[str, Any]:
+        """
+        Return copies of the declared fields that are not excluded.
+
+        DRF deep copies every declared field for each serializer instance, which
+        dominates the cost of serializing comments one at a time. The deep copy is
+        done once per class instead, and each instance only gets shallow copies that
+        it can bind freely. Fields wrapping a child field (list fields and
+        ``many=True`` serializers) are still deep copied, so that the child is bound
+        to this instance rather than shared with every other one.
+        """
+        return {
+            name: copy.deepcopy(field) if hasattr(field, "child") else copy.copy(field)
+            for name, field in self.get_active_fields()
+        }
 
     def get_children(self, obj: Any) -> list[dict[str, Any]]:
         """Get comments of a thread."""
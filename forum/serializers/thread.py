@@ -5,7 +5,6 @@ Serializer for the thread data.
 from typing import Any, Optional
 
 from rest_framework import serializers
-from rest_framework.serializers import ValidationError
 
 from forum.serializers.comment import CommentSerializer
 from forum.serializers.contents import ContentSerializer
@@ -216,8 +215,7 @@ class ThreadSerializer(ContentSerializer):
                 exclude_fields=["sk"],
                 backend=self.backend,
             )
-            if not serializer.is_valid(raise_exception=True):
-                raise ValidationError(serializer.errors)
+            serializer.is_valid(raise_exception=True)
             return serializer.data
         return []
 
@@ -1,20 +1,43 @@
 """Forum Utils."""
 
+import hashlib
+import json
 import logging
 from datetime import datetime
-from typing import Any, Sequence
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Optional, Sequence
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.dispatch import Signal
 from django.http import HttpRequest
 from django.utils import timezone
+from requests.adapters import HTTPAdapter
 from requests.models import Response
 
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_proxy_session() -> requests.Session:
+    """
+    Return the HTTP session used to proxy requests to forum/cs_comments_service.
+
+    The session is shared by the whole process so that TCP (and TLS) connections
+    to the comments service are kept alive and reused between requests. It never
+    stores cookies, as they would otherwise be sent on behalf of other users.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def handle_proxy_requests(request: HttpRequest, suffix: str, method: str) -> Response:
     """
     Catches all requests and sends them to forum/cs_comments_service URLs.
@@ -45,7 +68,7 @@ def handle_proxy_requests(request: HttpRequest, suffix: str, method: str) -> Res
         request_params,
         request_data,
     )
-    return requests.request(
+    return get_proxy_session().request(
         method,
         url,
         data=request_data,
@@ -248,5 +271,124 @@ def get_sort_criteria(sort_key: str) -> Sequence[tuple[str, int]]:
         return []
 
 
+def get_commentables_counts_cache_key(course_id: str) -> str:
+    """
+    Return the cache key of the commentables counts for a course.
+    """
+    return f"forum:commentables_counts:{course_id}"
+
+
+def invalidate_commentables_counts(course_id: Optional[str]) -> None:
+    """
+    Drop the cached commentables counts of a course.
+
+    Args:
+        course_id (Optional[str]): The course of the thread that changed.
+    """
+    if course_id:
+        cache.delete(get_commentables_counts_cache_key(course_id))
+
+
+def _get_forum_user_version_key(user_id: str) -> str:
+    """
+    Return the cache key holding the version of the serialized forum user.
+    """
+    return f"forum:forum_user_version:{user_id}"
+
+
+def get_forum_user_cache_key(user_id: str, course_id: Optional[str] = None) -> str:
+    """
+    Return the cache key of a serialized forum user, for a course or for all courses.
+
+    The key embeds the current version of the user, so that bumping it with
+    `invalidate_forum_user_cache` makes every cached serialization of the user
+    unreachable at once.
+    """
+    version_key = _get_forum_user_version_key(user_id)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, 1, timeout=None)
+        version = cache.get(version_key, 1)
+    return f"forum:forum_user:{user_id}:{version}:{course_id or ''}"
+
+
+def invalidate_forum_user_cache(user_id: str) -> None:
+    """
+    Make the cached serializations of a forum user stale.
+
+    Args:
+        user_id (str): The user whose data, course stats or read states changed.
+    """
+    try:
+        cache.incr(_get_forum_user_version_key(user_id))
+    except ValueError:
+        # Nothing was cached against this version yet.
+        pass
+
+
+def _get_search_threads_version_keys(
+    course_id: Optional[str] = None, user_id: Optional[str] = None
+) -> list[str]:
+    """
+    Return the cache keys holding the search versions of a course and of a user.
+    """
+    keys = []
+    if course_id:
+        keys.append(f"forum:search_threads_version:course:{course_id}")
+    if user_id:
+        keys.append(f"forum:search_threads_version:user:{user_id}")
+    return keys
+
+
+def get_search_threads_cache_key(
+    course_id: str, user_id: str, params: dict[str, Any]
+) -> str:
+    """
+    Return the cache key of a search_threads response.
+
+    The key embeds the current search versions of the course and of the user, so
+    that bumping either of them with `invalidate_search_threads_cache` makes every
+    cached response of the course (or of the user) unreachable at once.
+
+    Args:
+        course_id (str): The course the search is performed in.
+        user_id (str): The user performing the search.
+        params (dict[str, Any]): The remaining search parameters.
+
+    Returns:
+        str: The cache key.
+    """
+    version_keys = _get_search_threads_version_keys(course_id, user_id)
+    versions = cache.get_many(version_keys)
+    for key in version_keys:
+        if key not in versions:
+            cache.add(key, 1, timeout=None)
+            versions[key] = cache.get(key, 1)
+    digest = hashlib.md5(
+        json.dumps(params, sort_keys=True, default=str).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    version = ":".join(str(versions[key]) for key in version_keys)
+    return f"forum:search_threads:{course_id}:{user_id}:{version}:{digest}"
+
+
+def invalidate_search_threads_cache(
+    course_id: Optional[str] = None, user_id: Optional[str] = None
+) -> None:
+    """
+    Make the cached search_threads responses of a course and/or of a user stale.
+
+    Args:
+        course_id (Optional[str]): The course whose threads or comments changed.
+        user_id (Optional[str]): The user whose read states changed.
+    """
+    for key in _get_search_threads_version_keys(course_id, user_id):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Nothing was cached against this version yet.
+            pass
+
+
 class ForumV2RequestError(Exception):
     pass
@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 import mongomock
 import pytest
+from django.core.cache import cache
 from pymongo import MongoClient
 from pymongo.database import Database
 
@@ -96,3 +97,11 @@ def patched_mongo_backend(monkeypatch: pytest.MonkeyPatch) -> Generator[Any, Any
         lambda course_id: False,
     )
     yield MongoBackend
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Generator[Any, Any, Any]:
+    """Clear the django cache between tests."""
+    cache.clear()
+    yield
+    cache.clear()
@@ -3,6 +3,8 @@
 Tests for the `forum` models module.
 """
 
+from datetime import datetime
+
 from forum.backends.mongodb import Users
 
 
@@ -93,3 +95,48 @@ def test_update() -> None:
     assert user_data["external_id"] == external_id
     assert user_data["username"] == new_username
     assert user_data["email"] == new_email
+
+
+def test_increment_course_stats() -> None:
+    """Test increment the course stats of a user in mongodb"""
+    external_id = "test_external_id"
+    Users().insert(external_id, "test_username", "test_email")
+    Users().update(
+        external_id,
+        course_stats=[
+            {"course_id": "course1", "replies": 1, "responses": 0},
+            {"course_id": "course2", "replies": 5, "responses": 5},
+        ],
+    )
+
+    assert Users().increment_course_stats(external_id, "course1", replies=-1) == 1
+    assert Users().increment_course_stats(external_id, "course3", replies=1) == 0
+
+    user_data = Users().get(external_id)
+    assert user_data is not None
+    assert user_data["course_stats"] == [
+        {"course_id": "course1", "replies": 0, "responses": 0},
+        {"course_id": "course2", "replies": 5, "responses": 5},
+    ]
+
+
+def test_update_last_read_time() -> None:
+    """Test set the last read time of a thread in mongodb"""
+    external_id = "test_external_id"
+    first_read, second_read = datetime(2024, 1, 1), datetime(2024, 1, 2)
+    Users().insert(external_id, "test_username", "test_email")
+
+    Users().update_last_read_time(external_id, "course1", "thread1", first_read)
+    Users().update_last_read_time(external_id, "course1", "thread2", first_read)
+    Users().update_last_read_time(external_id, "course1", "thread1", second_read)
+    Users().update_last_read_time(external_id, "course2", "thread3", first_read)
+
+    user_data = Users().get(external_id)
+    assert user_data is not None
+    assert [
+        (read_state["course_id"], read_state["last_read_times"])
+        for read_state in user_data["read_states"]
+    ] == [
+        ("course1", {"thread1": second_read, "thread2": first_read}),
+        ("course2", {"thread3": first_read}),
+    ]
@@ -1,16 +1,26 @@
 """Tests for db client."""
 
+from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 from forum.backends.mysql.models import (
     AbuseFlagger,
+    Comment,
     CommentThread,
     CourseStat,
+    HistoricalAbuseFlagger,
+    LastReadTime,
+    ReadState,
+    Subscription,
+    UserVote,
 )
 from forum.backends.mysql.api import MySQLBackend as backend
+from forum.constants import RETIRED_BODY, RETIRED_TITLE
 
 User = get_user_model()
 
@@ -38,6 +48,31 @@ def test_flag_as_abuse() -> None:
     assert flagged_comment_thread["abuse_flaggers"] == [str(flag_user.pk)]
 
 
+@pytest.mark.django_db
+def test_flag_as_abuse_counts_the_first_flag_for_the_author() -> None:
+    """Test that only the first flag of an entity is counted, for its author."""
+    author = User.objects.create(username="author-user")
+    flaggers = [User.objects.create(username=f"flag-user-{i}") for i in range(2)]
+    comment_thread = CommentThread.objects.create(
+        author=author,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    for flagger in [flaggers[0], flaggers[0], flaggers[1]]:
+        flagged_comment_thread = backend.flag_as_abuse(
+            str(flagger.pk),
+            str(comment_thread.pk),
+            entity_type=comment_thread.type,
+        )
+
+    assert sorted(flagged_comment_thread["abuse_flaggers"]) == sorted(
+        str(flagger.pk) for flagger in flaggers
+    )
+    assert CourseStat.objects.get(user=author, course_id="course123").active_flags == 1
+    assert not CourseStat.objects.filter(user__in=flaggers).exists()
+
+
 @pytest.mark.django_db
 def test_un_flag_as_abuse_success() -> None:
     """test for un_flag_as_abuse works successfully."""
@@ -91,6 +126,321 @@ def test_un_flag_all_as_abuse_historical_flags_updated() -> None:
     assert len(comment_thread.historical_abuse_flaggers) == 1
 
 
+@pytest.mark.django_db
+def test_un_flag_all_as_abuse_keeps_existing_historical_flags() -> None:
+    """Test that un_flag_all_as_abuse only adds the missing historical flags."""
+    author = User.objects.create(username="author-user")
+    flaggers = [User.objects.create(username=f"flag-user-{i}") for i in range(3)]
+    comment_thread = CommentThread.objects.create(
+        author=author,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    for flagger in flaggers:
+        AbuseFlagger.objects.create(user=flagger, content=comment_thread)
+    HistoricalAbuseFlagger.objects.create(user=flaggers[0], content=comment_thread)
+
+    un_flagged_comment_thread = backend.un_flag_all_as_abuse(
+        comment_thread.pk,
+        entity_type=comment_thread.type,
+    )
+
+    assert un_flagged_comment_thread["abuse_flaggers"] == []
+    assert sorted(un_flagged_comment_thread["historical_abuse_flaggers"]) == sorted(
+        str(flagger.pk) for flagger in flaggers
+    )
+
+
+@pytest.mark.django_db
+def test_update_thread_adds_abuse_flaggers() -> None:
+    """Test that updating the flaggers of a thread only adds the new ones."""
+    users = [User.objects.create(username=f"user{i}") for i in range(3)]
+    comment_thread = CommentThread.objects.create(
+        author=users[0],
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    AbuseFlagger.objects.create(user=users[0], content=comment_thread)
+
+    backend.update_thread(
+        str(comment_thread.pk),
+        abuse_flaggers=[str(user.pk) for user in users],
+        historical_abuse_flaggers=[str(users[1].pk)],
+    )
+    assert sorted(AbuseFlagger.objects.values_list("user_id", flat=True)) == sorted(
+        user.pk for user in users
+    )
+    assert list(HistoricalAbuseFlagger.objects.values_list("user_id", flat=True)) == [
+        users[1].pk
+    ]
+
+
+@pytest.mark.django_db
+def test_filter_standalone_threads(django_assert_num_queries: Any) -> None:
+    """Test that comments on standalone threads are filtered out in one query."""
+    user = User.objects.create(username="testuser")
+    threads = [
+        CommentThread.objects.create(
+            author=user,
+            course_id="course123",
+            title=f"Test Thread {context}",
+            body="This is a test thread",
+            context=context,
+        )
+        for context in ["course", "standalone"]
+    ]
+    comment_ids = [
+        str(
+            Comment.objects.create(
+                author=user,
+                course_id="course123",
+                body="This is a test comment",
+                comment_thread=thread,
+            ).pk
+        )
+        for thread in [threads[0], threads[1], threads[0]]
+    ]
+
+    with django_assert_num_queries(1):
+        thread_ids = backend.filter_standalone_threads(comment_ids)
+    assert thread_ids == [str(threads[0].pk)] * 2
+
+
+@pytest.mark.django_db
+def test_get_endorsed(django_assert_num_queries: Any) -> None:
+    """Test that the endorsed threads are found without loading the threads."""
+    user = User.objects.create(username="testuser")
+    threads = [
+        CommentThread.objects.create(
+            author=user,
+            course_id="course123",
+            title=f"Test Thread {i}",
+            body="This is a test thread",
+        )
+        for i in range(3)
+    ]
+    for thread, endorsed in zip(threads, [True, False, True]):
+        Comment.objects.create(
+            author=user,
+            course_id="course123",
+            body="Comment",
+            comment_thread=thread,
+            endorsed=endorsed,
+        )
+
+    with django_assert_num_queries(1):
+        endorsed_threads = backend.get_endorsed([str(thread.pk) for thread in threads])
+    assert endorsed_threads == {str(threads[0].pk): True, str(threads[2].pk): True}
+
+
+@pytest.mark.django_db
+def test_get_abuse_flagged_count(django_assert_num_queries: Any) -> None:
+    """Test that the flagged comments of each thread are counted in one query."""
+    user = User.objects.create(username="testuser")
+    flaggers = [User.objects.create(username=f"flag-user-{i}") for i in range(2)]
+    threads = [
+        CommentThread.objects.create(
+            author=user,
+            course_id="course123",
+            title=f"Test Thread {i}",
+            body="This is a test thread",
+        )
+        for i in range(2)
+    ]
+    comments = [
+        Comment.objects.create(
+            author=user,
+            course_id="course123",
+            body="This is a test comment",
+            comment_thread=threads[0],
+        )
+        for _ in range(3)
+    ]
+    for flagger in flaggers:
+        AbuseFlagger.objects.create(user=flagger, content=comments[0])
+    AbuseFlagger.objects.create(user=flaggers[0], content=comments[1])
+    AbuseFlagger.objects.create(user=flaggers[0], content=threads[1])
+
+    with django_assert_num_queries(1):
+        flagged_counts = backend.get_abuse_flagged_count(
+            [str(thread.pk) for thread in threads]
+        )
+    assert flagged_counts == {str(threads[0].pk): 2}
+
+
+@pytest.mark.django_db
+def test_get_read_states(django_assert_num_queries: Any) -> None:
+    """Test that read states and unread comment counts are read in one query."""
+    user = User.objects.create(username="reader")
+    author = User.objects.create(username="author")
+    now = timezone.now()
+    threads = [
+        CommentThread.objects.create(
+            author=author,
+            course_id="course123",
+            title=f"Test Thread {i}",
+            body="This is a test thread",
+            last_activity_at=now - timedelta(hours=i),
+        )
+        for i in range(3)
+    ]
+    read_state = ReadState.objects.create(user=user, course_id="course123")
+    LastReadTime.objects.create(
+        read_state=read_state,
+        comment_thread=threads[0],
+        timestamp=now - timedelta(minutes=30),
+    )
+    LastReadTime.objects.create(
+        read_state=read_state, comment_thread=threads[1], timestamp=now
+    )
+    for comment_author in [author, author, user]:
+        Comment.objects.create(
+            author=comment_author,
+            course_id="course123",
+            body="This is a test comment",
+            comment_thread=threads[0],
+        )
+
+    thread_ids = [str(thread.pk) for thread in threads]
+    with django_assert_num_queries(1):
+        read_states = backend.get_read_states(thread_ids, str(user.pk), "course123")
+    assert read_states == {
+        str(threads[0].pk): [False, 2],
+        str(threads[1].pk): [True, 0],
+    }
+    assert backend.get_read_states(thread_ids, str(author.pk), "course123") == {}
+
+
+@pytest.mark.django_db
+def test_retire_all_content() -> None:
+    """Test that retiring a user's content overwrites only its body and title."""
+    user = User.objects.create(username="testuser")
+    comment_thread = CommentThread.objects.create(
+        author=user,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    comment = Comment.objects.create(
+        author=user,
+        course_id="course123",
+        body="This is a test comment",
+        comment_thread=comment_thread,
+    )
+
+    backend.retire_all_content(str(user.pk), user.username)
+
+    comment_thread.refresh_from_db()
+    comment.refresh_from_db()
+    assert comment_thread.title == RETIRED_TITLE
+    assert comment_thread.body == RETIRED_BODY
+    assert comment_thread.course_id == "course123"
+    assert comment_thread.comment_count == 1
+    assert comment.body == RETIRED_BODY
+    assert comment.course_id == "course123"
+
+
+@pytest.mark.django_db
+def test_update_vote() -> None:
+    """Test that voting again on a content overwrites the previous vote."""
+    user = User.objects.create(username="testuser")
+    comment_thread = CommentThread.objects.create(
+        author=user,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    entity_type = comment_thread.type
+
+    assert backend.upvote_content(comment_thread.pk, user.pk, entity_type=entity_type)
+    assert list(UserVote.objects.values_list("user_id", "vote")) == [(user.pk, 1)]
+
+    assert backend.downvote_content(comment_thread.pk, user.pk, entity_type=entity_type)
+    assert list(UserVote.objects.values_list("user_id", "vote")) == [(user.pk, -1)]
+
+    assert backend.remove_vote(comment_thread.pk, user.pk, entity_type=entity_type)
+    assert not UserVote.objects.exists()
+    assert not backend.remove_vote(comment_thread.pk, user.pk, entity_type=entity_type)
+
+
+@pytest.mark.django_db
+def test_get_entity_from_type_only_loads_requested_fields() -> None:
+    """Test that entities fetched for their id or course do not load their body."""
+    user = User.objects.create(username="testuser")
+    comment_thread = CommentThread.objects.create(
+        author=user,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+
+    entity = backend._get_entity_from_type(
+        str(comment_thread.pk), "CommentThread", only=("course_id",)
+    )
+    assert entity is not None
+    assert entity.course_id == "course123"
+    assert "body" in entity.get_deferred_fields()
+
+    entity = backend._get_entity_from_type(str(comment_thread.pk), "CommentThread")
+    assert entity is not None
+    assert not entity.get_deferred_fields()
+
+
+@pytest.mark.django_db
+def test_get_user_voted_ids(django_assert_num_queries: Any) -> None:
+    """Test that the up and down votes of a user are read in a single query."""
+    user = User.objects.create(username="testuser")
+    threads = [
+        CommentThread.objects.create(
+            author=user,
+            course_id="course123",
+            title=f"Test Thread {i}",
+            body="This is a test thread",
+        )
+        for i in range(3)
+    ]
+    UserVote.objects.create(user=user, content=threads[0], vote=1)
+    UserVote.objects.create(user=user, content=threads[1], vote=-1)
+    UserVote.objects.create(user=user, content=threads[2], vote=1)
+
+    with django_assert_num_queries(1):
+        voted_ids = backend._get_user_voted_ids_by_vote(user.pk)
+    assert sorted(voted_ids["up"]) == [threads[0].pk, threads[2].pk]
+    assert voted_ids["down"] == [threads[1].pk]
+
+    with django_assert_num_queries(1):
+        down_voted_ids = backend.get_user_voted_ids(user.pk, "down")
+    assert down_voted_ids == [threads[1].pk]
+
+
+@pytest.mark.django_db
+def test_find_subscribed_threads(django_assert_num_queries: Any) -> None:
+    """Test that the subscribed threads of a course are found in a single query."""
+    user = User.objects.create(username="testuser")
+    threads = [
+        CommentThread.objects.create(
+            author=user,
+            course_id=course_id,
+            title="Test Thread",
+            body="This is a test thread",
+        )
+        for course_id in ["course123", "course456", "course123"]
+    ]
+    for thread in threads:
+        Subscription.objects.create(subscriber=user, source=thread)
+
+    backend.find_subscribed_threads(user.pk)
+    with django_assert_num_queries(1):
+        thread_ids = backend.find_subscribed_threads(user.pk, "course123")
+    assert sorted(thread_ids) == sorted([str(threads[0].pk), str(threads[2].pk)])
+    assert len(backend.find_subscribed_threads(user.pk)) == 3
+
+    backend.update_thread(str(threads[1].pk), course_id="course123")
+    assert len(backend.find_subscribed_threads(user.pk, "course123")) == 3
+
+
 @pytest.mark.django_db
 def test_update_stats_for_course_creates_new_stat() -> None:
     """Test that a new CourseStat is created with default values."""
@@ -108,7 +458,7 @@ def test_update_stats_for_course_creates_new_stat() -> None:
 
 @pytest.mark.django_db
 def test_update_stats_for_course_updates_existing_stat() -> None:
-    """Test that an existing CourseStat is updated correctly."""
+    """Test that the counters of an existing CourseStat are incremented."""
     user = User.objects.create(username="testuser")
     user_2 = User.objects.create(username="testuser2")
     course_id = "course123"
@@ -137,8 +487,9 @@ def test_update_stats_for_course_updates_existing_stat() -> None:
     backend.update_stats_for_course(str(user.pk), course_id, active_flags=2, threads=2)
 
     course_stat.refresh_from_db()
-    assert course_stat.active_flags == 2
+    assert course_stat.active_flags == 4
     assert course_stat.threads == 2
+    assert course_stat.last_activity_at is not None
 
 
 @pytest.mark.django_db
@@ -175,3 +526,132 @@ def test_update_stats_for_course_calls_build_course_stats() -> None:
     with patch.object(backend, "build_course_stats") as mock_build_course_stats:
         backend.update_stats_for_course(str(user.pk), course_id, active_flags=1)
         mock_build_course_stats.assert_called_once_with(str(user.pk), course_id)
+
+
+@pytest.mark.django_db
+def test_build_course_stats(django_assert_max_num_queries: Any) -> None:
+    """Test that build_course_stats counts the posts and flags of a user."""
+    user = User.objects.create(username="testuser")
+    flag_user = User.objects.create(username="flag-user")
+    course_id = "course123"
+    threads = [
+        CommentThread.objects.create(
+            author=user,
+            course_id=course_id,
+            title="Test Thread",
+            body="This is a test thread",
+            thread_type="discussion",
+            context="course",
+            anonymous=anonymous,
+        )
+        for anonymous in [False, False, True]
+    ]
+    response = Comment.objects.create(
+        author=user, course_id=course_id, body="Response", comment_thread=threads[0]
+    )
+    reply = Comment.objects.create(
+        author=user,
+        course_id=course_id,
+        body="Reply",
+        comment_thread=threads[0],
+        parent=response,
+    )
+    for content in [threads[0], reply, threads[2]]:
+        AbuseFlagger.objects.create(user=user, content=content)
+        AbuseFlagger.objects.create(user=flag_user, content=content)
+    HistoricalAbuseFlagger.objects.create(user=user, content=response)
+
+    # The two aggregates, the UPDATE, and update_or_create with its savepoints.
+    with django_assert_max_num_queries(9):
+        backend.build_course_stats(str(user.pk), course_id)
+    # Stats that already exist are overwritten with a single UPDATE.
+    with django_assert_max_num_queries(3):
+        backend.build_course_stats(str(user.pk), course_id)
+
+    course_stat = CourseStat.objects.get(user=user, course_id=course_id)
+    assert course_stat.threads == 2
+    assert course_stat.responses == 1
+    assert course_stat.replies == 1
+    assert course_stat.active_flags == 2
+    assert course_stat.inactive_flags == 1
+    assert course_stat.last_activity_at == max(
+        thread.updated_at for thread in threads[:2] + [response, reply]
+    )
+
+
+@pytest.mark.django_db
+def test_threads_presentor_uses_read_states_and_endorsements() -> None:
+    """Test that threads_presentor keeps the order and state of the given threads."""
+    user = User.objects.create(username="testuser")
+    threads = [
+        CommentThread.objects.create(
+            author=user,
+            course_id="course123",
+            title=f"Test Thread {index}",
+            body="This is a test thread",
+            thread_type="question",
+            context="course",
+            last_activity_at=timezone.now(),
+        )
+        for index in range(2)
+    ]
+    thread_ids = [thread.pk for thread in reversed(threads)]
+    backend.mark_as_read(str(user.pk), str(threads[0].pk))
+    backend.create_comment(
+        {
+            "body": "Endorsed response",
+            "course_id": "course123",
+            "author_id": str(user.pk),
+            "comment_thread_id": str(threads[1].pk),
+        }
+    )
+    Comment.objects.filter(comment_thread=threads[1]).update(endorsed=True)
+
+    presenters = backend.threads_presentor(thread_ids, str(user.pk), "course123")
+
+    assert [presenter["_id"] for presenter in presenters] == [
+        str(threads[1].pk),
+        str(threads[0].pk),
+    ]
+    assert [presenter["read"] for presenter in presenters] == [False, True]
+    assert [presenter["endorsed"] for presenter in presenters] == [True, False]
+
+
+@pytest.mark.django_db
+def test_user_to_hash_counts_threads_and_comments_in_groups(
+    django_assert_num_queries: Any,
+) -> None:
+    """Test that user_to_hash counts the posts of a user in the given groups."""
+    user = User.objects.create(username="testuser")
+    backend.find_or_create_user(str(user.pk), username=user.username)
+    threads = {
+        (group_id, context): CommentThread.objects.create(
+            author=user,
+            course_id="course123",
+            title="Test Thread",
+            body="This is a test thread",
+            thread_type="discussion",
+            context=context,
+            group_id=group_id,
+        )
+        for group_id in [None, 1, 2]
+        for context in ["course", "standalone"]
+    }
+    for thread in threads.values():
+        Comment.objects.create(
+            author=user,
+            course_id="course123",
+            body="This is a test comment",
+            comment_thread=thread,
+        )
+
+    hash_data = backend.user_to_hash(str(user.pk), {"course_id": "course123"})
+    assert hash_data["threads_count"] == 6
+    assert hash_data["comments_count"] == 3
+
+    with django_assert_num_queries(1):
+        hash_data = backend.user_to_hash(
+            str(user.pk), {"course_id": "course123", "group_ids": [1]}
+        )
+    assert hash_data["threads_count"] == 4
+    assert hash_data["comments_count"] == 2
@@ -1,6 +1,7 @@
 """Tests for mysql models."""
 
 from datetime import timedelta
+from typing import Any
 
 import pytest
 from django.contrib.auth import get_user_model
@@ -106,7 +107,7 @@ def test_comment_thread_creation() -> None:
     assert comment_thread.thread_type == "discussion"
     assert comment_thread.context == "course"
     assert comment_thread.closed is False
-    assert comment_thread.pinned is None
+    assert comment_thread.pinned is False
 
 
 @pytest.mark.django_db
@@ -137,6 +138,205 @@ def test_comment_creation() -> None:
     assert comment.sort_key is None
 
 
+@pytest.mark.django_db
+def test_comment_thread_comment_count() -> None:
+    """Test that the comment count of a thread follows its comments."""
+    user = User.objects.create(
+        username="testuser", email="test@example.com", password="password"
+    )
+    threads = [
+        CommentThread.objects.create(
+            author=user,
+            course_id="course123",
+            title=f"Test Thread {i}",
+            body="This is a test thread",
+        )
+        for i in range(2)
+    ]
+    comments = [
+        Comment.objects.create(
+            author=user,
+            course_id="course123",
+            body=f"Comment {i}",
+            comment_thread=threads[0],
+        )
+        for i in range(3)
+    ]
+
+    def get_comment_counts() -> list[int]:
+        return [
+            CommentThread.objects.get(pk=thread.pk).comment_count for thread in threads
+        ]
+
+    assert get_comment_counts() == [3, 0]
+
+    threads[0].title = "Stale thread"
+    threads[0].save()
+    assert get_comment_counts() == [3, 0]
+
+    comments[0].comment_thread = threads[1]
+    comments[0].save()
+    comments[1].save()
+    assert get_comment_counts() == [2, 1]
+
+    loaded_comment = Comment.objects.get(pk=comments[1].pk)
+    loaded_comment.comment_thread = threads[1]
+    loaded_comment.save()
+    assert get_comment_counts() == [1, 2]
+
+    comments[2].delete()
+    assert get_comment_counts() == [0, 2]
+
+
+@pytest.mark.django_db
+def test_iter_index_documents(django_assert_num_queries: Any) -> None:
+    """Test that the search documents built from values match doc_to_hash."""
+    users = [
+        User.objects.create(username=f"user{i}", email=f"user{i}@example.com")
+        for i in range(3)
+    ]
+    threads = [
+        CommentThread.objects.create(
+            author=users[0],
+            course_id="course123",
+            title=f"Test Thread {i}",
+            body="This is a test thread",
+        )
+        for i in range(2)
+    ]
+    for user, vote in zip(users, [1, 1, -1]):
+        UserVote.objects.create(user=user, content=threads[0], vote=vote)
+    comment = Comment.objects.create(
+        author=users[1],
+        course_id="course123",
+        body="This is a test comment",
+        comment_thread=threads[0],
+    )
+
+    with django_assert_num_queries(1):
+        thread_documents = dict(
+            CommentThread.iter_index_documents(CommentThread.objects.all())
+        )
+    assert thread_documents == {
+        str(thread.pk): CommentThread.objects.get(pk=thread.pk).doc_to_hash()
+        for thread in threads
+    }
+    assert thread_documents[str(threads[0].pk)]["votes_point"] == 1
+    assert thread_documents[str(threads[0].pk)]["comment_count"] == 1
+
+    with django_assert_num_queries(1):
+        comment_documents = dict(Comment.iter_index_documents(Comment.objects.all()))
+    assert comment_documents == {str(comment.pk): comment.doc_to_hash()}
+
+
+@pytest.mark.django_db
+def test_comment_get_parent_ids(django_assert_num_queries: Any) -> None:
+    """Test that the parent IDs of a comment are read without loading its parents."""
+    user = User.objects.create(
+        username="testuser", email="test@example.com", password="password"
+    )
+    comment_thread = CommentThread.objects.create(
+        author=user,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    comments: list[Comment] = []
+    for depth in range(4):
+        comments.append(
+            Comment.objects.create(
+                author=user,
+                course_id="course123",
+                body=f"Comment {depth}",
+                comment_thread=comment_thread,
+                parent=comments[-1] if comments else None,
+                depth=depth,
+            )
+        )
+    response, reply, nested_reply, deepest_reply = (
+        Comment.objects.get(pk=comment.pk) for comment in comments
+    )
+
+    with django_assert_num_queries(0):
+        assert response.get_parent_ids() == []
+        assert reply.get_parent_ids() == [str(response.pk)]
+    with django_assert_num_queries(1):
+        assert nested_reply.get_parent_ids() == [str(reply.pk), str(response.pk)]
+    with django_assert_num_queries(1):
+        assert deepest_reply.get_parent_ids() == [
+            str(nested_reply.pk),
+            str(reply.pk),
+            str(response.pk),
+        ]
+
+
+@pytest.mark.django_db
+def test_comment_get_list() -> None:
+    """Test that Comment.get_list filters comments and sorts them by sort key."""
+    user = User.objects.create(
+        username="testuser", email="test@example.com", password="password"
+    )
+    comment_thread = CommentThread.objects.create(
+        author=user,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    comments = [
+        Comment.objects.create(
+            author=user,
+            course_id="course123",
+            body=f"Comment {i}",
+            comment_thread=comment_thread,
+            sort_key=sort_key,
+        )
+        for i, sort_key in enumerate(["b", None, "a"])
+    ]
+    ids = [str(comment.pk) for comment in comments]
+
+    def get_ids(**kwargs: Any) -> list[str]:
+        return [
+            comment["_id"]
+            for comment in Comment.get_list(
+                comment_thread_id=comment_thread.pk, **kwargs
+            )
+        ]
+
+    assert sorted(get_ids()) == sorted(ids)
+    assert get_ids(sort=1) == [ids[2], ids[0], ids[1]]
+    assert get_ids(sort=-1) == [ids[1], ids[0], ids[2]]
+
+
+@pytest.mark.django_db
+def test_comment_get_many(django_assert_num_queries: Any) -> None:
+    """Test that Comment.get_many reads several comments and their authors at once."""
+    user = User.objects.create(
+        username="testuser", email="test@example.com", password="password"
+    )
+    comment_thread = CommentThread.objects.create(
+        author=user,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    comments = [
+        Comment.objects.create(
+            author=user,
+            course_id="course123",
+            body=f"Comment {i}",
+            comment_thread=comment_thread,
+        )
+        for i in range(3)
+    ]
+
+    with django_assert_num_queries(5):
+        found = Comment.get_many([str(comment.pk) for comment in comments[:2]])
+        assert [comment.author.username for comment in found.values()] == [
+            "testuser"
+        ] * 2
+    assert sorted(found) == [comments[0].pk, comments[1].pk]
+
+
 @pytest.mark.django_db
 def test_comment_thread_update() -> None:
     """Test that a Comment's thread is updated when the thread is updated."""
@@ -237,6 +437,72 @@ def test_comment_delete() -> None:
     assert Comment.objects.filter(id=comment.pk).count() == 0
 
 
+@pytest.mark.django_db
+def test_forum_user_to_dict_is_cached(django_assert_num_queries: Any) -> None:
+    """Test that ForumUser.to_dict is cached until the user's data changes."""
+    user = User.objects.create(
+        username="testuser", email="test@example.com", password="password"
+    )
+    forum_user = ForumUser.objects.create(user=user, default_sort_key="date")
+    thread = CommentThread.objects.create(
+        author=user,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    course_stat = CourseStat.objects.create(user=user, course_id="course123")
+
+    assert forum_user.to_dict("course123")["course_stats"]["threads"] == 0
+    with django_assert_num_queries(0):
+        forum_user.to_dict("course123")
+
+    course_stat.threads = 1
+    course_stat.save()
+    assert forum_user.to_dict("course123")["course_stats"]["threads"] == 1
+
+    read_state = ReadState.objects.create(user=user, course_id="course123")
+    assert forum_user.to_dict()["read_states"][0]["last_read_times"] == {}
+    last_read_time = LastReadTime.objects.create(
+        read_state=read_state, comment_thread=thread, timestamp=timezone.now()
+    )
+    assert forum_user.to_dict()["read_states"][0]["last_read_times"] == {
+        str(thread.pk): last_read_time.timestamp
+    }
+
+    user.username = "renamed"
+    user.save()
+    assert forum_user.to_dict()["username"] == "renamed"
+
+    user.delete()
+    assert not ReadState.objects.exists()
+
+
+@pytest.mark.django_db
+def test_forum_user_bulk_to_dict(django_assert_num_queries: Any) -> None:
+    """Test that several forum users are serialized in a fixed number of queries."""
+    users = [
+        User.objects.create(username=f"user{i}", email=f"user{i}@example.com")
+        for i in range(3)
+    ]
+    for user in users:
+        ForumUser.objects.create(user=user)
+        CourseStat.objects.create(user=user, course_id="course123", threads=user.pk)
+        ReadState.objects.create(user=user, course_id="course123")
+    user_ids = [user.pk for user in reversed(users)]
+
+    with django_assert_num_queries(4):
+        data = ForumUser.bulk_to_dict(user_ids, course_id="course123")
+    assert [user["username"] for user in data] == ["user2", "user1", "user0"]
+    assert [user["course_stats"]["threads"] for user in data] == user_ids
+    assert data == [
+        ForumUser.objects.get(user=user)._to_dict("course123")
+        for user in reversed(users)
+    ]
+
+    with django_assert_num_queries(0):
+        assert ForumUser.bulk_to_dict(user_ids, course_id="course123") == data
+
+
 @pytest.mark.django_db
 def test_forum_user_delete() -> None:
     """Test that a ForumUser's data is deleted when the user is deleted."""
@@ -299,6 +565,47 @@ def test_edit_history_update() -> None:
     assert edit_history.reason_code == "needs-clarity"
 
 
+@pytest.mark.django_db
+def test_get_edit_history(django_assert_num_queries: Any) -> None:
+    """Test that the edit history and its editors are read in a single query."""
+    user = User.objects.create(
+        username="testuser", email="test@example.com", password="password"
+    )
+    editors = [
+        User.objects.create(username=f"editor{i}", email=f"editor{i}@example.com")
+        for i in range(2)
+    ]
+    comment_thread = CommentThread.objects.create(
+        author=user,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    edits = [
+        EditHistory.objects.create(
+            reason_code="grammar-spelling",
+            original_body=f"Original body {i}",
+            editor=editor,
+            content=comment_thread,
+        )
+        for i, editor in enumerate(editors)
+    ]
+
+    with django_assert_num_queries(1):
+        edit_history = comment_thread.get_edit_history()
+    assert sorted(edit_history, key=lambda edit: edit["_id"]) == [
+        {
+            "_id": str(edit.pk),
+            "original_body": edit.original_body,
+            "reason_code": "grammar-spelling",
+            "editor_username": editor.username,
+            "author_id": editor.pk,
+            "created_at": edit.created_at,
+        }
+        for edit, editor in zip(edits, editors)
+    ]
+
+
 @pytest.mark.django_db
 def test_edit_history_delete() -> None:
     """Test that an EditHistory is deleted when a Comment is deleted."""
@@ -676,6 +983,34 @@ def test_readstate_multiple_last_read_times() -> None:
     assert read_state.last_read_times.filter(comment_thread=comment_thread2).exists()
 
 
+@pytest.mark.django_db
+def test_readstate_to_dict(django_assert_num_queries: Any) -> None:
+    """Test that ReadState.to_dict reads its last read times without their threads."""
+    user = User.objects.create(
+        username="testuser", email="test@example.com", password="password"
+    )
+    read_state = ReadState.objects.create(user=user, course_id="course123")
+    threads = [
+        CommentThread.objects.create(
+            author=user,
+            course_id="course123",
+            title=f"Test Thread {i}",
+            body="This is a test thread",
+        )
+        for i in range(3)
+    ]
+    timestamp = timezone.now()
+    for thread in threads:
+        LastReadTime.objects.create(
+            read_state=read_state, comment_thread=thread, timestamp=timestamp
+        )
+
+    read_state = ReadState.objects.get(pk=read_state.pk)
+    with django_assert_num_queries(1):
+        data = read_state.to_dict()
+    assert data["last_read_times"] == {str(thread.pk): timestamp for thread in threads}
+
+
 @pytest.mark.django_db
 def test_readstate_last_read_time_update() -> None:
     """Test that updating a LastReadTime instance updates the read state's last read time."""
@@ -812,6 +1147,69 @@ def test_uservotes_generic_foreign_key() -> None:
     assert uservote2.content_type == ContentType.objects.get_for_model(CommentThread)
 
 
+@pytest.mark.django_db
+def test_votes_summary(django_assert_num_queries: Any) -> None:
+    """Test that the votes summary of a content is read once, in a single query."""
+    users = [
+        User.objects.create(username=f"user{i}", email=f"user{i}@example.com")
+        for i in range(3)
+    ]
+    thread = CommentThread.objects.create(
+        author=users[0],
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    UserVote.objects.create(user=users[0], content=thread, vote=1)
+    UserVote.objects.create(user=users[1], content=thread, vote=1)
+    UserVote.objects.create(user=users[2], content=thread, vote=-1)
+
+    thread = CommentThread.objects.get(pk=thread.pk)
+    with django_assert_num_queries(1):
+        votes = thread.votes_summary
+        assert thread.votes_summary is votes
+    assert sorted(votes["up"]) == sorted([users[0].pk, users[1].pk])
+    assert votes["down"] == [users[2].pk]
+    assert votes["up_count"] == 2
+    assert votes["down_count"] == 1
+    assert votes["count"] == 3
+    assert votes["point"] == 1
+
+
+@pytest.mark.django_db
+def test_with_serializable_prefetches_related_rows(
+    django_assert_num_queries: Any,
+) -> None:
+    """Test that the votes, flaggers and edits of serializable threads are read at once."""
+    user = User.objects.create(username="user", email="user@example.com")
+    for i in range(3):
+        thread = CommentThread.objects.create(
+            author=user,
+            course_id="course123",
+            title=f"Test Thread {i}",
+            body="This is a test thread",
+        )
+        UserVote.objects.create(user=user, content=thread, vote=1)
+        AbuseFlagger.objects.create(user=user, content=thread)
+        EditHistory.objects.create(
+            editor=user, original_body="Original body", content=thread
+        )
+
+    with django_assert_num_queries(5):
+        threads = list(CommentThread.with_serializable().order_by("pk"))
+        summaries = [thread.votes_summary for thread in threads]
+        assert [thread.author.username for thread in threads] == ["user"] * 3
+        assert [thread.abuse_flaggers for thread in threads] == [[user.pk]] * 3
+        assert [thread.historical_abuse_flaggers for thread in threads] == [[]] * 3
+        edit_histories = [thread.get_edit_history() for thread in threads]
+    assert edit_histories == [
+        CommentThread.objects.get(pk=thread.pk).get_edit_history() for thread in threads
+    ]
+    assert [edit["editor_username"] for (edit,) in edit_histories] == ["user"] * 3
+    assert all(summary["up"] == [user.pk] for summary in summaries)
+    assert all(summary["point"] == 1 for summary in summaries)
+
+
 @pytest.mark.django_db
 def test_subscription_creation() -> None:
     """Test that a subscription is created when a user votes on a content."""
@@ -827,6 +1225,39 @@ def test_subscription_creation() -> None:
     assert subscription.source_object_id == 1
 
 
+@pytest.mark.django_db
+def test_subscription_course_id(django_assert_num_queries: Any) -> None:
+    """Test that a subscription copies the course of its source only when missing."""
+    user = User.objects.create(username="testuser")
+    thread = CommentThread.objects.create(
+        author=user,
+        course_id="course123",
+        title="Test Thread",
+        body="This is a test thread",
+    )
+    content_type = ContentType.objects.get_for_model(CommentThread)
+
+    with django_assert_num_queries(1):
+        subscription = Subscription.objects.create(
+            subscriber=user, source=thread, course_id="course123"
+        )
+    assert subscription.course_id == "course123"
+    subscription.delete()
+
+    with django_assert_num_queries(1):
+        subscription = Subscription.objects.create(subscriber=user, source=thread)
+    assert subscription.course_id == "course123"
+    subscription.delete()
+
+    with django_assert_num_queries(2):
+        subscription = Subscription.objects.create(
+            subscriber=user,
+            source_content_type=content_type,
+            source_object_id=thread.pk,
+        )
+    assert subscription.course_id == "course123"
+
+
 @pytest.mark.django_db
 def test_subscription_unique_together() -> None:
     """Test that the unique together constraint is enforced."""
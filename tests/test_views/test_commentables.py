@@ -6,7 +6,9 @@ import random
 import uuid
 
 import pytest
+from django.core.cache import cache
 
+from forum.utils import get_commentables_counts_cache_key
 from test_utils.client import APIClient
 
 pytestmark = pytest.mark.django_db
@@ -67,3 +69,71 @@ def test_get_commentables_counts_api(
 
     assert response.status_code == 200
     assert response.json() == id_map
+
+
+def test_get_commentables_counts_cache_is_invalidated(
+    api_client: APIClient, patched_get_backend: Any
+) -> None:
+    """
+    Test that cached commentables counts are refreshed when a thread is created.
+    """
+    backend = patched_get_backend()
+    username = "test_user"
+    user_id = backend.find_or_create_user("1", username=username)
+    course_id = "abcd"
+    thread_data = {
+        "title": "Question Thread",
+        "body": "This is a question thread.",
+        "course_id": course_id,
+        "commentable_id": "commentable",
+        "thread_type": "question",
+        "author_id": user_id,
+        "author_username": username,
+        "abuse_flaggers": [],
+        "historical_abuse_flaggers": [],
+    }
+    backend.create_thread(thread_data)
+
+    response = api_client.get_json(f"/api/v2/commentables/{course_id}/counts", {})
+    assert response.json() == {"commentable": {"question": 1, "discussion": 0}}
+
+    backend.create_thread(thread_data)
+
+    response = api_client.get_json(f"/api/v2/commentables/{course_id}/counts", {})
+    assert response.json() == {"commentable": {"question": 2, "discussion": 0}}
+
+
+def test_get_commentables_counts_cache_survives_unrelated_updates(
+    api_client: APIClient, patched_get_backend: Any
+) -> None:
+    """
+    Test that cached counts are only refreshed by updates that change them.
+    """
+    backend = patched_get_backend()
+    username = "test_user"
+    user_id = backend.find_or_create_user("1", username=username)
+    course_id = "abcd"
+    thread_id = backend.create_thread(
+        {
+            "title": "Question Thread",
+            "body": "This is a question thread.",
+            "course_id": course_id,
+            "commentable_id": "commentable",
+            "thread_type": "question",
+            "author_id": user_id,
+            "author_username": username,
+            "abuse_flaggers": [],
+            "historical_abuse_flaggers": [],
+        }
+    )
+    api_client.get_json(f"/api/v2/commentables/{course_id}/counts", {})
+    cache_key = get_commentables_counts_cache_key(course_id)
+
+    backend.update_thread(thread_id, pinned=True)
+    assert cache.get(cache_key) is not None
+
+    backend.update_thread(thread_id, thread_type="discussion")
+    assert cache.get(cache_key) is None
+
+    response = api_client.get_json(f"/api/v2/commentables/{course_id}/counts", {})
+    assert response.json() == {"commentable": {"question": 0, "discussion": 1}}
@@ -1,8 +1,12 @@
 """Test comments api endpoints."""
 
+from datetime import datetime
 from typing import Any
 import pytest
+from django.test import override_settings
 
+from forum.api.comments import prepare_comment_api_response
+from forum.serializers.comment import CommentSerializer
 from test_utils.client import APIClient
 
 pytestmark = pytest.mark.django_db
@@ -305,3 +309,123 @@ def test_thread_comment_post_api(
     parent_comment = backend.get_comment(comment["id"])
     assert parent_comment is not None
     assert parent_comment["child_count"] == 0
+
+
+def test_thread_comment_post_api_returns_400_when_thread_does_not_exist(
+    api_client: APIClient, patched_get_backend: Any
+) -> None:
+    """
+    Test that no comment is created on a thread that does not exist.
+    """
+    backend = patched_get_backend
+    user_id, _, _ = setup_models(backend)
+    incorrect_thread_id = backend.generate_id()
+
+    response = api_client.post_json(
+        f"/api/v2/threads/{incorrect_thread_id}/comments",
+        data={
+            "body": "<p>Child Comment 1</p>",
+            "course_id": "course-xyz",
+            "user_id": user_id,
+        },
+    )
+    assert response.status_code == 400
+    assert response.json() == {
+        "error": f"Thread does not exist with Id: {incorrect_thread_id}"
+    }
+
+
+def test_comment_serializers_do_not_share_fields(patched_get_backend: Any) -> None:
+    """
+    Test that serializing comments one after another does not leak data between them.
+    """
+    backend = patched_get_backend()
+    user_id, thread_id, parent_comment_id = setup_models(backend)
+    child_comment_id = backend.create_comment(
+        {
+            "body": "<p>Child Comment</p>",
+            "course_id": "course-xyz",
+            "author_id": user_id,
+            "comment_thread_id": thread_id,
+            "parent_id": parent_comment_id,
+            "depth": 1,
+        }
+    )
+    flagged_comment = {
+        **backend.get_comment(parent_comment_id),
+        "abuse_flaggers": ["2"],
+        "edit_history": [
+            {
+                "original_body": "<p>Original</p>",
+                "reason_code": None,
+                "editor_username": "user1",
+                "created_at": datetime.now(),
+            }
+        ],
+    }
+    unflagged_comment = {
+        **backend.get_comment(child_comment_id),
+        "abuse_flaggers": [],
+        "edit_history": [],
+    }
+
+    flagged_data = prepare_comment_api_response(
+        flagged_comment, backend, exclude_fields=["sk"]
+    )
+    unflagged_data = prepare_comment_api_response(
+        unflagged_comment, backend, exclude_fields=["endorsement", "sk"]
+    )
+    flagged_data_again = prepare_comment_api_response(
+        flagged_comment, backend, exclude_fields=["sk"]
+    )
+
+    assert flagged_data["abuse_flaggers"] == ["2"]
+    assert flagged_data["edit_history"][0]["original_body"] == "<p>Original</p>"
+    assert "endorsement" in flagged_data
+    assert unflagged_data["abuse_flaggers"] == []
+    assert unflagged_data["edit_history"] == []
+    assert "endorsement" not in unflagged_data
+    assert flagged_data_again == flagged_data
+
+    serializer = CommentSerializer(data=flagged_comment, backend=backend)
+    edit_history_field = serializer.fields["edit_history"]
+    assert edit_history_field.child.parent is edit_history_field
+    assert edit_history_field.root is serializer
+    assert serializer.fields["abuse_flaggers"].child.parent is (
+        serializer.fields["abuse_flaggers"]
+    )
+
+
+@override_settings(TIME_ZONE="UTC")
+def test_comment_response_is_the_same_without_validation(
+    patched_get_backend: Any,
+) -> None:
+    """
+    Test that serializing a stored comment without validation gives the same response.
+
+    Validation converts dates to the current time zone, which is UTC in edx-platform.
+    """
+    backend = patched_get_backend()
+    user_id, thread_id, parent_comment_id = setup_models(backend)
+    backend.update_comment(parent_comment_id, endorsed=True)
+    child_comment_id = backend.create_comment(
+        {
+            "body": "<p>Child Comment</p>",
+            "course_id": "course-xyz",
+            "author_id": user_id,
+            "comment_thread_id": thread_id,
+            "parent_id": parent_comment_id,
+            "depth": 1,
+        }
+    )
+
+    for comment_id, exclude_fields in [
+        (parent_comment_id, ["sk"]),
+        (child_comment_id, ["endorsement", "sk"]),
+    ]:
+        comment = backend.get_comment(comment_id)
+        assert prepare_comment_api_response(
+            comment, backend, exclude_fields=exclude_fields
+        ) == prepare_comment_api_response(
+            comment, backend, exclude_fields=exclude_fields, skip_validation=False
+        )
@@ -0,0 +1,64 @@
+"""Test forum v1 proxy api endpoints."""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import requests
+from django.test import RequestFactory
+from requests.cookies import MockRequest, create_cookie
+
+from forum.utils import get_proxy_session
+from forum.views.proxy import ForumProxyAPIView
+
+
+def proxy_response() -> MagicMock:
+    """Return a fake response of forum/cs_comments_service."""
+    response = MagicMock()
+    response.status_code = 200
+    response.content = b'{"status": "ok"}'
+    response.json.return_value = {"status": "ok"}
+    return response
+
+
+def test_proxy_requests_reuse_the_session() -> None:
+    """
+    Test that proxied requests all go through the same session, unchanged.
+    """
+    factory = RequestFactory()
+    view = ForumProxyAPIView.as_view()
+    session = get_proxy_session()
+    with patch.object(
+        session, "request", return_value=proxy_response()
+    ) as mock_request:
+        for _ in range(2):
+            request = factory.get(
+                "/forum/api/v1/threads",
+                {"course_id": "course-xyz"},
+                HTTP_X_EDX_API_KEY="api-key",
+                HTTP_ACCEPT_LANGUAGE="en",
+            )
+            response: Any = view(request, suffix="threads")
+            assert response.status_code == 200
+            assert response.data == {"status": "ok"}
+
+    assert get_proxy_session() is session
+    assert mock_request.call_count == 2
+    for call in mock_request.call_args_list:
+        assert call.args == ("get", "http://forum:4567/api/v1/threads")
+        assert call.kwargs == {
+            "data": {},
+            "params": {"course_id": "course-xyz"},
+            "headers": {"X-Edx-Api-Key": "api-key", "Accept-Language": "en"},
+            "timeout": 5.0,
+        }
+
+
+def test_proxy_session_does_not_store_cookies() -> None:
+    """
+    Test that cookies set by forum/cs_comments_service are never kept by the session.
+    """
+    cookie = create_cookie("sessionid", "secret", domain="forum")
+    request = MockRequest(
+        requests.Request("GET", "http://forum:4567/api/v1/threads").prepare()
+    )
+    assert not get_proxy_session().cookies.get_policy().set_ok(cookie, request)
@@ -852,3 +852,87 @@ def test_unicode_data(api_client: APIClient, patched_get_backend: Any) -> None:
     assert response.status_code == 200
     json = response.json()["collection"]
     assert len(json) == 1, f"Expected 1 result, but got {len(json)}"
+
+
+def test_search_results_are_cached_until_the_course_changes(
+    api_client: APIClient, patched_get_backend: Any
+) -> None:
+    """
+    Test that identical searches are served from the cache until a thread changes.
+    """
+    backend = patched_get_backend()
+    user_id = "1"
+    user_name = "test_user"
+    course_id = "course-v1:Arbisoft+SE002+2024_S2"
+    backend.find_or_create_user(user_id, username=user_name)
+    thread_id = backend.create_thread(
+        {
+            "title": "title-1",
+            "course_id": course_id,
+            "body": "body-1",
+            "author_id": user_id,
+            "author_username": user_name,
+            "commentable_id": "course",
+        }
+    )
+    params = {"course_id": course_id, "text": "title", "user_id": user_id}
+
+    response = get_search_response(api_client, params, [thread_id])
+    assert_result_total(response, 1)
+
+    # The search index is not queried again for an identical search.
+    response = get_search_response(api_client, params, [])
+    assert_result_total(response, 1)
+
+    # Reading a thread makes the cached searches of the user stale.
+    backend.mark_as_read(user_id, thread_id)
+    response = get_search_response(api_client, params, [])
+    assert_result_total(response, 0)
+
+    # Updating a thread makes the cached searches of the course stale.
+    backend.update_thread(thread_id=thread_id, title="updated-title")
+    response = get_search_response(api_client, params, [thread_id])
+    assert_result_total(response, 1)
+
+
+def test_search_results_cache_is_invalidated_by_votes_and_flags(
+    api_client: APIClient, patched_get_backend: Any
+) -> None:
+    """
+    Test that voting on or flagging a thread makes the cached searches of its course stale.
+    """
+    backend = patched_get_backend()
+    user_id = "1"
+    user_name = "test_user"
+    course_id = "course-v1:Arbisoft+SE002+2024_S2"
+    backend.find_or_create_user(user_id, username=user_name)
+    thread_id = backend.create_thread(
+        {
+            "title": "title-1",
+            "course_id": course_id,
+            "body": "body-1",
+            "author_id": user_id,
+            "author_username": user_name,
+            "commentable_id": "course",
+        }
+    )
+    params = {"course_id": course_id, "text": "title", "user_id": user_id}
+
+    response = get_search_response(api_client, params, [thread_id])
+    assert response.json()["collection"][0]["votes"]["up_count"] == 0
+
+    backend.upvote_content(thread_id, user_id, entity_type="CommentThread")
+    response = get_search_response(api_client, params, [thread_id])
+    assert response.json()["collection"][0]["votes"]["up_count"] == 1
+
+    backend.remove_vote(thread_id, user_id, entity_type="CommentThread")
+    response = get_search_response(api_client, params, [thread_id])
+    assert response.json()["collection"][0]["votes"]["up_count"] == 0
+
+    backend.flag_as_abuse(user_id, thread_id, entity_type="CommentThread")
+    response = get_search_response(api_client, params, [thread_id])
+    assert response.json()["collection"][0]["abuse_flaggers"] == [user_id]
+
+    backend.un_flag_as_abuse(user_id, thread_id, entity_type="CommentThread")
+    response = get_search_response(api_client, params, [thread_id])
+    assert response.json()["collection"][0]["abuse_flaggers"] == []